@@ -7,10 +7,19 @@ and visual feedback for learning milestones.
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from functools import cached_property, lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, MutableMapping, NamedTuple, Optional, Set, Tuple
 from enum import Enum
 import json
 
+# orjson is optional (the "fast-json" extra); fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class CustomizationCategory(str, Enum):
     """Categories of character customization options"""
@@ -33,6 +42,24 @@ class UnlockCondition(str, Enum):
     CULTURAL_CELEBRATION = "cultural_celebration"
 
 
+def encode_json(payload: Dict[str, any]) -> bytes:
+    """Encode a to_dict() payload as UTF-8 JSON for the API layer"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Same bytes as orjson: compact separators, non-ASCII left unescaped
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Fixed slot layout for ChildProgress.equipped_items (one slot per category)
+CATEGORY_LABELS = tuple(category.value for category in CustomizationCategory)
+CATEGORY_INDEX = {category: idx for idx, category in enumerate(CustomizationCategory)}
+
+
+def _copy_config(config: Dict[str, any]) -> Dict[str, any]:
+    """Copy of a shared item config, including its list values"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in config.items()}
+
+
 @dataclass
 class CustomizationItem:
     """A single customization item for the character"""
@@ -46,21 +73,53 @@ class CustomizationItem:
     cultural_significance: Optional[str] = None
     seasonal_availability: Optional[List[str]] = None
     rarity: str = "common"  # common, rare, legendary
+    _category_value: str = field(init=False, repr=False, compare=False)
+    _category_idx: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Cache the raw category string and its equipped_items slot
+        self._category_value = self.category.value
+        self._category_idx = CATEGORY_INDEX[self.category]
     
     def to_dict(self) -> Dict[str, any]:
         """Convert to dictionary for storage and API"""
+        # Items are shared by every service, so nested containers are copied
+        seasonal_availability = self.seasonal_availability
         return {
             "item_id": self.item_id,
             "name": self.name,
             "description": self.description,
-            "category": self.category.value,
+            "category": self._category_value,
             "unlock_condition": self.unlock_condition.value,
-            "unlock_requirements": self.unlock_requirements,
-            "visual_config": self.visual_config,
+            "unlock_requirements": dict(self.unlock_requirements),
+            "visual_config": _copy_config(self.visual_config),
             "cultural_significance": self.cultural_significance,
-            "seasonal_availability": self.seasonal_availability,
+            "seasonal_availability": (
+                list(seasonal_availability) if seasonal_availability is not None else None
+            ),
             "rarity": self.rarity
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes for the API"""
+        return encode_json(self.to_dict())
+
+
+class _CelebrationContext(dict):
+    """Activity context for celebration templates; unknown fields render verbatim"""
+    
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _compile_celebration_message(message: str) -> Callable[[Dict[str, any]], str]:
+    """Parse a celebration message once and return its renderer"""
+    has_fields = any(
+        field_name is not None for _, field_name, _, _ in Formatter().parse(message)
+    )
+    if not has_fields:
+        return lambda context: message
+    return lambda context: message.format_map(_CelebrationContext(context))
 
 
 @dataclass
@@ -73,6 +132,10 @@ class LearningMilestone:
     reward_items: List[str]  # List of customization item IDs
     celebration_message: str
     cultural_context: Optional[str] = None
+    _render: Callable[[Dict[str, any]], str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._render = _compile_celebration_message(self.celebration_message)
 
 
 @dataclass 
@@ -87,8 +150,33 @@ class ChildProgress:
     cultural_events_participated: int = 0
     milestones_achieved: Set[str] = field(default_factory=set)
     unlocked_items: Set[str] = field(default_factory=set)
-    equipped_items: Dict[str, str] = field(default_factory=dict)  # category -> item_id
+    # item_id per category slot, indexed via CATEGORY_INDEX
+    equipped_items: List[Optional[str]] = field(
+        default_factory=lambda: [None] * len(CATEGORY_LABELS)
+    )
     last_activity_date: float = field(default_factory=time.time)
+    # Bumped by add_unlocked so derived views of unlocked_items can be cached
+    unlock_version: int = 0
+    _unlocked_view: Optional[Tuple[int, Tuple["CustomizationItem", ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def add_unlocked(self, item_id: str) -> bool:
+        """Unlock an item; returns True if it was not already unlocked"""
+        unlocked_before = len(self.unlocked_items)
+        self.unlocked_items.add(item_id)
+        if len(self.unlocked_items) == unlocked_before:
+            return False
+        self.unlock_version += 1
+        return True
+    
+    def equipped_by_category(self) -> Dict[str, str]:
+        """Map category label -> equipped item_id for occupied slots"""
+        return {
+            category: item_id
+            for category, item_id in zip(CATEGORY_LABELS, self.equipped_items)
+            if item_id is not None
+        }
     
     def to_dict(self) -> Dict[str, any]:
         """Convert to dictionary for storage"""
@@ -102,368 +190,532 @@ class ChildProgress:
             "cultural_events_participated": self.cultural_events_participated,
             "milestones_achieved": list(self.milestones_achieved),
             "unlocked_items": list(self.unlocked_items),
-            "equipped_items": self.equipped_items,
+            "equipped_items": self.equipped_by_category(),
             "last_activity_date": self.last_activity_date
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes for storage"""
+        return encode_json(self.to_dict())
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> "ChildProgress":
+        """Rebuild progress from a to_dict() payload"""
+        equipped_items = [None] * len(CATEGORY_LABELS)
+        for category, item_id in data["equipped_items"].items():
+            equipped_items[CATEGORY_INDEX[CustomizationCategory(category)]] = item_id
+        return cls(
+            child_id=data["child_id"],
+            lessons_completed=data["lessons_completed"],
+            current_streak=data["current_streak"],
+            longest_streak=data["longest_streak"],
+            perfect_scores=data["perfect_scores"],
+            total_interactions=data["total_interactions"],
+            cultural_events_participated=data["cultural_events_participated"],
+            milestones_achieved=set(data["milestones_achieved"]),
+            unlocked_items=set(data["unlocked_items"]),
+            equipped_items=equipped_items,
+            last_activity_date=data["last_activity_date"]
+        )
+
+
+def _handle_lesson_completed(progress: ChildProgress, context: Dict[str, any]) -> None:
+    progress.lessons_completed += 1
+    progress.current_streak += 1
+    progress.longest_streak = max(progress.longest_streak, progress.current_streak)
+    
+    if context.get("perfect_score", False):
+        progress.perfect_scores += 1
+
+
+def _handle_lesson_failed(progress: ChildProgress, context: Dict[str, any]) -> None:
+    progress.current_streak = 0
+
+
+def _handle_cultural_event(progress: ChildProgress, context: Dict[str, any]) -> None:
+    progress.cultural_events_participated += 1
+
+
+# activity_type -> counter update; unknown activities only count as interactions
+_ACTIVITY_HANDLERS: Dict[str, Callable[[ChildProgress, Dict[str, any]], None]] = {
+    "lesson_completed": _handle_lesson_completed,
+    "lesson_failed": _handle_lesson_failed,
+    "cultural_event": _handle_cultural_event,
+}
+
+
+def _unlock_context(context: Dict[str, any]) -> Tuple[str, Optional[str], Optional[str], bool]:
+    """Extract the context values unlock checks depend on, with their defaults"""
+    return (
+        context.get("season", "spring"),
+        context.get("cultural_focus"),
+        context.get("current_celebration"),
+        context.get("participation", False)
+    )
+
+
+class ProgressUpdateResult(NamedTuple):
+    """Outcome of update_child_progress"""
+    progress_updated: bool
+    newly_unlocked_items: List[Dict[str, any]]
+    milestones_achieved: List[Dict[str, any]]
+    current_progress: Dict[str, any]
+
+
+# Raw library data; CharacterCustomizationService builds these into model
+# objects once per process and shares them between service instances.
+_ITEM_SPECS = (
+    # Seasonal Clothing
+    dict(
+        item_id="spring_cardigan",
+        name="Spring Shamrock Cardigan",
+        description="Light green cardigan with shamrock patterns for Irish spring",
+        category=CustomizationCategory.CLOTHING,
+        unlock_condition=UnlockCondition.SEASONAL_EVENT,
+        unlock_requirements={"season": "spring", "lessons_in_season": 3},
+        visual_config={
+            "clothing_type": "cardigan",
+            "color": "light_green",
+            "pattern": "shamrocks",
+            "style": "casual"
+        },
+        cultural_significance="Represents Irish spring traditions and connection to nature",
+        seasonal_availability=["spring"],
+        rarity="common"
+    ),
+
+    dict(
+        item_id="summer_gaa_shirt",
+        name="Dublin GAA Training Shirt",
+        description="Bright blue and white shirt like Dublin GAA team colors",
+        category=CustomizationCategory.CLOTHING,
+        unlock_condition=UnlockCondition.STREAK_ACHIEVED,
+        unlock_requirements={"streak_length": 5, "season": "summer"},
+        visual_config={
+            "clothing_type": "sports_shirt",
+            "color": "dublin_blue",
+            "accent_color": "white",
+            "pattern": "team_stripes"
+        },
+        cultural_significance="Celebrates Irish GAA sports culture and teamwork",
+        seasonal_availability=["summer"],
+        rarity="rare"
+    ),
+
+    dict(
+        item_id="autumn_wool_sweater",
+        name="Cozy Irish Wool Sweater",
+        description="Warm orange sweater with traditional Irish cable knit patterns",
+        category=CustomizationCategory.CLOTHING,
+        unlock_condition=UnlockCondition.MILESTONE_REACHED,
+        unlock_requirements={"milestone_id": "autumn_learning_master"},
+        visual_config={
+            "clothing_type": "sweater",
+            "color": "autumn_orange",
+            "pattern": "cable_knit",
+            "texture": "wool"
+        },
+        cultural_significance="Traditional Irish craftsmanship and autumn comfort",
+        seasonal_availability=["autumn"],
+        rarity="rare"
+    ),
+
+    dict(
+        item_id="winter_christmas_coat",
+        name="Festive Christmas Coat",
+        description="Warm red coat with snowflake patterns for Irish Christmas",
+        category=CustomizationCategory.CLOTHING,
+        unlock_condition=UnlockCondition.CULTURAL_CELEBRATION,
+        unlock_requirements={"celebration": "christmas", "participation": True},
+        visual_config={
+            "clothing_type": "coat",
+            "color": "festive_red",
+            "pattern": "snowflakes",
+            "style": "winter_formal"
+        },
+        cultural_significance="Irish Christmas traditions and family warmth",
+        seasonal_availability=["winter"],
+        rarity="legendary"
+    ),
+
+    # Accessories
+    dict(
+        item_id="chinese_hair_clips",
+        name="Traditional Chinese Hair Clips",
+        description="Beautiful red and gold hair clips with Chinese patterns",
+        category=CustomizationCategory.ACCESSORIES,
+        unlock_condition=UnlockCondition.LESSON_COMPLETED,
+        unlock_requirements={"lessons_count": 1},
+        visual_config={
+            "accessory_type": "hair_clips",
+            "color": "red_gold",
+            "pattern": "traditional_chinese",
+            "position": "hair_sides"
+        },
+        cultural_significance="Honors Chinese heritage and traditional beauty",
+        rarity="common"
+    ),
+
+    dict(
+        item_id="trinity_college_pin",
+        name="Trinity College Dublin Pin",
+        description="Special pin representing Dublin's famous university",
+        category=CustomizationCategory.ACCESSORIES,
+        unlock_condition=UnlockCondition.PERFECT_SCORE,
+        unlock_requirements={"perfect_scores": 3},
+        visual_config={
+            "accessory_type": "pin",
+            "color": "trinity_blue",
+            "design": "college_crest",
+            "position": "cardigan_lapel"
+        },
+        cultural_significance="Represents educational excellence and Dublin pride",
+        rarity="rare"
+    ),
+
+    # Hairstyles
+    dict(
+        item_id="chinese_buns",
+        name="Traditional Chinese Buns",
+        description="Elegant hair buns with decorative Chinese hair accessories",
+        category=CustomizationCategory.HAIRSTYLE,
+        unlock_condition=UnlockCondition.CULTURAL_CELEBRATION,
+        unlock_requirements={"celebration": "chinese_new_year", "participation": True},
+        visual_config={
+            "hairstyle_type": "twin_buns",
+            "accessories": "chinese_traditional",
+            "color": "natural_black",
+            "style": "formal_traditional"
+        },
+        cultural_significance="Traditional Chinese hairstyle for special occasions",
+        rarity="legendary"
+    ),
+
+    # Backgrounds
+    dict(
+        item_id="dublin_zoo_background",
+        name="Dublin Zoo Adventure",
+        description="Colorful background featuring Dublin Zoo with friendly animals",
+        category=CustomizationCategory.BACKGROUND,
+        unlock_condition=UnlockCondition.STREAK_ACHIEVED,
+        unlock_requirements={"streak_length": 7},
+        visual_config={
+            "background_type": "outdoor_scene",
+            "location": "dublin_zoo",
+            "elements": ["animals", "trees", "playground"],
+            "mood": "cheerful_adventure"
+        },
+        cultural_significance="Celebrates Dublin landmarks children love",
+        rarity="rare"
+    ),
+
+    dict(
+        item_id="phoenix_park_background",
+        name="Phoenix Park Picnic",
+        description="Beautiful park setting with Dublin's Phoenix Park",
+        category=CustomizationCategory.BACKGROUND,
+        unlock_condition=UnlockCondition.MILESTONE_REACHED,
+        unlock_requirements={"milestone_id": "dublin_explorer"},
+        visual_config={
+            "background_type": "park_scene",
+            "location": "phoenix_park",
+            "elements": ["grass", "trees", "monument", "picnic_setup"],
+            "mood": "peaceful_family"
+        },
+        cultural_significance="Dublin's largest park, perfect for family activities",
+        rarity="rare"
+    ),
+)
+
+_MILESTONE_SPECS = (
+    dict(
+        milestone_id="first_lesson",
+        name="First Steps",
+        description="Complete your very first lesson with Xiao Mei",
+        requirements={"lessons_completed": 1},
+        reward_items=["chinese_hair_clips"],
+        celebration_message="你好! Welcome to learning! Here are special Chinese hair clips to celebrate! 很好!"
+    ),
+    dict(
+        milestone_id="streak_starter",
+        name="Learning Streak",
+        description="Complete 3 lessons in a row",
+        requirements={"current_streak": 3},
+        reward_items=["spring_cardigan"],
+        celebration_message="Brilliant! You're on a learning streak! Here's a beautiful spring cardigan! 太棒了!"
+    ),
+    dict(
+        milestone_id="gaa_champion",
+        name="GAA Team Spirit",
+        description="Achieve 5 perfect scores like a GAA champion",
+        requirements={"perfect_scores": 5},
+        reward_items=["summer_gaa_shirt"],
+        celebration_message="Fair play! You're a champion learner! Here's your Dublin GAA shirt! 冠军!"
+    ),
+    dict(
+        milestone_id="dublin_explorer",
+        name="Dublin Explorer",
+        description="Complete 10 lessons about Dublin culture",
+        requirements={"lessons_completed": 10, "cultural_focus": "dublin"},
+        reward_items=["phoenix_park_background", "trinity_college_pin"],
+        celebration_message="Grand! You know Dublin well now! Here are special Dublin rewards! 都柏林专家!"
+    ),
+    dict(
+        milestone_id="autumn_learning_master",
+        name="Autumn Learning Master",
+        description="Complete 15 lessons during autumn season",
+        requirements={"lessons_completed": 15, "season": "autumn"},
+        reward_items=["autumn_wool_sweater"],
+        celebration_message="Lovely! You're an autumn learning master! Here's a cozy Irish sweater! 秋天大师!"
+    ),
+)
 
 
 class CharacterCustomizationService:
     """Service for managing character customization and progress-based rewards"""
 
-    def __init__(self):
-        self.customization_items = self._initialize_customization_items()
-        self.learning_milestones = self._initialize_learning_milestones()
-        self.child_progress_store: Dict[str, ChildProgress] = {}
+    # __dict__ stays available for the lazily built cached_property indexes
+    __slots__ = ("customization_items", "learning_milestones", "child_progress_store", "__dict__")
 
-    def _initialize_customization_items(self) -> Dict[str, CustomizationItem]:
-        """Initialize the library of customization items"""
-        items = {}
-        
-        # Seasonal Clothing
-        items["spring_cardigan"] = CustomizationItem(
-            item_id="spring_cardigan",
-            name="Spring Shamrock Cardigan",
-            description="Light green cardigan with shamrock patterns for Irish spring",
-            category=CustomizationCategory.CLOTHING,
-            unlock_condition=UnlockCondition.SEASONAL_EVENT,
-            unlock_requirements={"season": "spring", "lessons_in_season": 3},
-            visual_config={
-                "clothing_type": "cardigan",
-                "color": "light_green",
-                "pattern": "shamrocks",
-                "style": "casual"
-            },
-            cultural_significance="Represents Irish spring traditions and connection to nature",
-            seasonal_availability=["spring"],
-            rarity="common"
-        )
-        
-        items["summer_gaa_shirt"] = CustomizationItem(
-            item_id="summer_gaa_shirt",
-            name="Dublin GAA Training Shirt",
-            description="Bright blue and white shirt like Dublin GAA team colors",
-            category=CustomizationCategory.CLOTHING,
-            unlock_condition=UnlockCondition.STREAK_ACHIEVED,
-            unlock_requirements={"streak_length": 5, "season": "summer"},
-            visual_config={
-                "clothing_type": "sports_shirt",
-                "color": "dublin_blue",
-                "accent_color": "white",
-                "pattern": "team_stripes"
-            },
-            cultural_significance="Celebrates Irish GAA sports culture and teamwork",
-            seasonal_availability=["summer"],
-            rarity="rare"
-        )
-        
-        items["autumn_wool_sweater"] = CustomizationItem(
-            item_id="autumn_wool_sweater",
-            name="Cozy Irish Wool Sweater",
-            description="Warm orange sweater with traditional Irish cable knit patterns",
-            category=CustomizationCategory.CLOTHING,
-            unlock_condition=UnlockCondition.MILESTONE_REACHED,
-            unlock_requirements={"milestone_id": "autumn_learning_master"},
-            visual_config={
-                "clothing_type": "sweater",
-                "color": "autumn_orange",
-                "pattern": "cable_knit",
-                "texture": "wool"
-            },
-            cultural_significance="Traditional Irish craftsmanship and autumn comfort",
-            seasonal_availability=["autumn"],
-            rarity="rare"
-        )
-        
-        items["winter_christmas_coat"] = CustomizationItem(
-            item_id="winter_christmas_coat",
-            name="Festive Christmas Coat",
-            description="Warm red coat with snowflake patterns for Irish Christmas",
-            category=CustomizationCategory.CLOTHING,
-            unlock_condition=UnlockCondition.CULTURAL_CELEBRATION,
-            unlock_requirements={"celebration": "christmas", "participation": True},
-            visual_config={
-                "clothing_type": "coat",
-                "color": "festive_red",
-                "pattern": "snowflakes",
-                "style": "winter_formal"
-            },
-            cultural_significance="Irish Christmas traditions and family warmth",
-            seasonal_availability=["winter"],
-            rarity="legendary"
-        )
-        
-        # Accessories
-        items["chinese_hair_clips"] = CustomizationItem(
-            item_id="chinese_hair_clips",
-            name="Traditional Chinese Hair Clips",
-            description="Beautiful red and gold hair clips with Chinese patterns",
-            category=CustomizationCategory.ACCESSORIES,
-            unlock_condition=UnlockCondition.LESSON_COMPLETED,
-            unlock_requirements={"lessons_count": 1},
-            visual_config={
-                "accessory_type": "hair_clips",
-                "color": "red_gold",
-                "pattern": "traditional_chinese",
-                "position": "hair_sides"
-            },
-            cultural_significance="Honors Chinese heritage and traditional beauty",
-            rarity="common"
-        )
-        
-        items["trinity_college_pin"] = CustomizationItem(
-            item_id="trinity_college_pin",
-            name="Trinity College Dublin Pin",
-            description="Special pin representing Dublin's famous university",
-            category=CustomizationCategory.ACCESSORIES,
-            unlock_condition=UnlockCondition.PERFECT_SCORE,
-            unlock_requirements={"perfect_scores": 3},
-            visual_config={
-                "accessory_type": "pin",
-                "color": "trinity_blue",
-                "design": "college_crest",
-                "position": "cardigan_lapel"
-            },
-            cultural_significance="Represents educational excellence and Dublin pride",
-            rarity="rare"
-        )
-        
-        # Hairstyles
-        items["chinese_buns"] = CustomizationItem(
-            item_id="chinese_buns",
-            name="Traditional Chinese Buns",
-            description="Elegant hair buns with decorative Chinese hair accessories",
-            category=CustomizationCategory.HAIRSTYLE,
-            unlock_condition=UnlockCondition.CULTURAL_CELEBRATION,
-            unlock_requirements={"celebration": "chinese_new_year", "participation": True},
-            visual_config={
-                "hairstyle_type": "twin_buns",
-                "accessories": "chinese_traditional",
-                "color": "natural_black",
-                "style": "formal_traditional"
-            },
-            cultural_significance="Traditional Chinese hairstyle for special occasions",
-            rarity="legendary"
-        )
-        
-        # Backgrounds
-        items["dublin_zoo_background"] = CustomizationItem(
-            item_id="dublin_zoo_background",
-            name="Dublin Zoo Adventure",
-            description="Colorful background featuring Dublin Zoo with friendly animals",
-            category=CustomizationCategory.BACKGROUND,
-            unlock_condition=UnlockCondition.STREAK_ACHIEVED,
-            unlock_requirements={"streak_length": 7},
-            visual_config={
-                "background_type": "outdoor_scene",
-                "location": "dublin_zoo",
-                "elements": ["animals", "trees", "playground"],
-                "mood": "cheerful_adventure"
-            },
-            cultural_significance="Celebrates Dublin landmarks children love",
-            rarity="rare"
+    def __init__(self, progress_store: Optional[MutableMapping[str, ChildProgress]] = None):
+        """
+        Args:
+            progress_store: Mapping used to keep ChildProgress records. Defaults to
+                an in-process dict; pass a persistent store (for example
+                SQLiteChildProgressStore) to share progress across workers.
+        """
+        self.customization_items = self._shared_items()
+        self.learning_milestones = self._shared_milestones()
+        self.child_progress_store: MutableMapping[str, ChildProgress] = (
+            progress_store if progress_store is not None else {}
         )
-        
-        items["phoenix_park_background"] = CustomizationItem(
-            item_id="phoenix_park_background",
-            name="Phoenix Park Picnic",
-            description="Beautiful park setting with Dublin's Phoenix Park",
-            category=CustomizationCategory.BACKGROUND,
-            unlock_condition=UnlockCondition.MILESTONE_REACHED,
-            unlock_requirements={"milestone_id": "dublin_explorer"},
-            visual_config={
-                "background_type": "park_scene",
-                "location": "phoenix_park",
-                "elements": ["grass", "trees", "monument", "picnic_setup"],
-                "mood": "peaceful_family"
-            },
-            cultural_significance="Dublin's largest park, perfect for family activities",
-            rarity="rare"
+
+    # Shared by every service in the process: read-only here, and results
+    # handed to callers copy the nested containers
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _shared_items(cls) -> Mapping[str, CustomizationItem]:
+        """Build the library of customization items once per process"""
+        return MappingProxyType(
+            {spec["item_id"]: CustomizationItem(**spec) for spec in _ITEM_SPECS}
         )
-        
-        return items
 
-    def _initialize_learning_milestones(self) -> Dict[str, LearningMilestone]:
-        """Initialize learning milestones that trigger rewards"""
-        return {
-            "first_lesson": LearningMilestone(
-                milestone_id="first_lesson",
-                name="First Steps",
-                description="Complete your very first lesson with Xiao Mei",
-                requirements={"lessons_completed": 1},
-                reward_items=["chinese_hair_clips"],
-                celebration_message="你好! Welcome to learning! Here are special Chinese hair clips to celebrate! 很好!"
-            ),
-            "streak_starter": LearningMilestone(
-                milestone_id="streak_starter",
-                name="Learning Streak",
-                description="Complete 3 lessons in a row",
-                requirements={"current_streak": 3},
-                reward_items=["spring_cardigan"],
-                celebration_message="Brilliant! You're on a learning streak! Here's a beautiful spring cardigan! 太棒了!"
-            ),
-            "gaa_champion": LearningMilestone(
-                milestone_id="gaa_champion",
-                name="GAA Team Spirit",
-                description="Achieve 5 perfect scores like a GAA champion",
-                requirements={"perfect_scores": 5},
-                reward_items=["summer_gaa_shirt"],
-                celebration_message="Fair play! You're a champion learner! Here's your Dublin GAA shirt! 冠军!"
-            ),
-            "dublin_explorer": LearningMilestone(
-                milestone_id="dublin_explorer",
-                name="Dublin Explorer",
-                description="Complete 10 lessons about Dublin culture",
-                requirements={"lessons_completed": 10, "cultural_focus": "dublin"},
-                reward_items=["phoenix_park_background", "trinity_college_pin"],
-                celebration_message="Grand! You know Dublin well now! Here are special Dublin rewards! 都柏林专家!"
-            ),
-            "autumn_learning_master": LearningMilestone(
-                milestone_id="autumn_learning_master",
-                name="Autumn Learning Master",
-                description="Complete 15 lessons during autumn season",
-                requirements={"lessons_completed": 15, "season": "autumn"},
-                reward_items=["autumn_wool_sweater"],
-                celebration_message="Lovely! You're an autumn learning master! Here's a cozy Irish sweater! 秋天大师!"
-            )
-        }
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _shared_milestones(cls) -> Mapping[str, LearningMilestone]:
+        """Build the learning milestones that trigger rewards once per process"""
+        return MappingProxyType({
+            spec["milestone_id"]: LearningMilestone(**spec) for spec in _MILESTONE_SPECS
+        })
+
+    @cached_property
+    def _items_by_season(self) -> Dict[str, List[CustomizationItem]]:
+        """Index of seasonal items, built on first use"""
+        index: Dict[str, List[CustomizationItem]] = {}
+        for item in self.customization_items.values():
+            for season in item.seasonal_availability or ():
+                index.setdefault(season, []).append(item)
+        return index
 
     def register_child(self, child_id: str) -> ChildProgress:
         """Register a new child for progress tracking"""
-        if child_id not in self.child_progress_store:
+        progress = self.child_progress_store.get(child_id)
+        if progress is None:
             progress = ChildProgress(child_id=child_id)
             # Start with basic Chinese accessories
-            progress.unlocked_items.add("chinese_hair_clips")
-            progress.equipped_items[CustomizationCategory.ACCESSORIES.value] = "chinese_hair_clips"
+            progress.add_unlocked("chinese_hair_clips")
+            progress.equipped_items[CATEGORY_INDEX[CustomizationCategory.ACCESSORIES]] = (
+                "chinese_hair_clips"
+            )
             self.child_progress_store[child_id] = progress
-        return self.child_progress_store[child_id]
+        return progress
 
     def update_child_progress(self, 
                             child_id: str, 
                             activity_type: str, 
-                            **context) -> Dict[str, any]:
+                            **context) -> ProgressUpdateResult:
         """Update child's progress and check for new unlocks"""
         progress = self.register_child(child_id)
         progress.last_activity_date = time.time()
         progress.total_interactions += 1
         
-        # Update progress based on activity type
         newly_unlocked = []
         milestones_achieved = []
         
-        if activity_type == "lesson_completed":
-            progress.lessons_completed += 1
-            progress.current_streak += 1
-            progress.longest_streak = max(progress.longest_streak, progress.current_streak)
+        handler = _ACTIVITY_HANDLERS.get(activity_type)
+        if handler is not None:
+            handler(progress, context)
+        self._evaluate_unlocks(progress, context, _unlock_context(context),
+                               newly_unlocked, milestones_achieved)
+        self.child_progress_store[child_id] = progress
+        
+        return ProgressUpdateResult(
+            progress_updated=True,
+            newly_unlocked_items=[item.to_dict() for item in newly_unlocked],
+            milestones_achieved=milestones_achieved,
+            current_progress=progress.to_dict()
+        )
+
+    def update_child_progress_bulk(self, 
+                                 child_id: str, 
+                                 events: List[Tuple[str, Dict[str, any]]]) -> ProgressUpdateResult:
+        """Replay a sequence of (activity_type, context) events for one child
+        
+        Counters only grow between streak resets, so within a run of events
+        sharing the same unlock context anything unlockable mid-run is still
+        unlockable at its end. Unlocks are therefore evaluated only before a
+        streak reset, when the unlock context changes, and after the last event.
+        """
+        progress = self.register_child(child_id)
+        
+        newly_unlocked = []
+        milestones_achieved = []
+        
+        if events:
+            progress.last_activity_date = time.time()
+            progress.total_interactions += len(events)
+            
+            unlock_contexts = [_unlock_context(context) for _, context in events]
+            last_idx = len(events) - 1
             
-            if context.get("perfect_score", False):
-                progress.perfect_scores += 1
+            for idx, (activity_type, context) in enumerate(events):
+                handler = _ACTIVITY_HANDLERS.get(activity_type)
+                if handler is not None:
+                    handler(progress, context)
                 
-        elif activity_type == "lesson_failed":
-            progress.current_streak = 0
+                if (idx == last_idx
+                        or events[idx + 1][0] == "lesson_failed"
+                        or unlock_contexts[idx + 1] != unlock_contexts[idx]):
+                    self._evaluate_unlocks(progress, context, unlock_contexts[idx],
+                                           newly_unlocked, milestones_achieved)
             
-        elif activity_type == "cultural_event":
-            progress.cultural_events_participated += 1
+            self.child_progress_store[child_id] = progress
+        
+        return ProgressUpdateResult(
+            progress_updated=bool(events),
+            newly_unlocked_items=[item.to_dict() for item in newly_unlocked],
+            milestones_achieved=milestones_achieved,
+            current_progress=progress.to_dict()
+        )
+
+    def _evaluate_unlocks(self, 
+                        progress: ChildProgress, 
+                        context: Dict[str, any],
+                        unlock_context: Tuple[str, Optional[str], Optional[str], bool],
+                        newly_unlocked: List[CustomizationItem],
+                        milestones_achieved: List[Dict[str, any]]) -> None:
+        """Check milestones and item unlocks, appending anything new to the lists"""
+        # Counters are fixed for the rest of this check, so read them once
+        counters = (
+            progress.lessons_completed,
+            progress.current_streak,
+            progress.perfect_scores,
+            progress.cultural_events_participated
+        )
+        season, cultural_focus, current_celebration, participation = unlock_context
         
         # Check for milestone achievements
         for milestone_id, milestone in self.learning_milestones.items():
             if milestone_id not in progress.milestones_achieved:
-                if self._check_milestone_requirements(progress, milestone, context):
+                if self._check_milestone_requirements(counters, milestone,
+                                                      season, cultural_focus):
                     progress.milestones_achieved.add(milestone_id)
-                    milestones_achieved.append(milestone)
+                    milestones_achieved.append({
+                        "milestone": milestone.name,
+                        "celebration_message": milestone._render(context),
+                        "rewards": list(milestone.reward_items)
+                    })
                     
                     # Unlock reward items
                     for item_id in milestone.reward_items:
-                        if item_id not in progress.unlocked_items:
-                            progress.unlocked_items.add(item_id)
+                        if progress.add_unlocked(item_id):
                             newly_unlocked.append(self.customization_items[item_id])
         
         # Check for additional item unlocks
         for item_id, item in self.customization_items.items():
             if item_id not in progress.unlocked_items:
-                if self._check_unlock_requirements(progress, item, context):
-                    progress.unlocked_items.add(item_id)
+                if self._check_unlock_requirements(counters, item, season,
+                                                   current_celebration, participation):
+                    progress.add_unlocked(item_id)
                     newly_unlocked.append(item)
-        
-        return {
-            "progress_updated": True,
-            "newly_unlocked_items": [item.to_dict() for item in newly_unlocked],
-            "milestones_achieved": [
-                {
-                    "milestone": milestone.name,
-                    "celebration_message": milestone.celebration_message,
-                    "rewards": milestone.reward_items
-                } for milestone in milestones_achieved
-            ],
-            "current_progress": progress.to_dict()
-        }
 
     def _check_milestone_requirements(self, 
-                                   progress: ChildProgress, 
+                                   counters: Tuple[int, int, int, int], 
                                    milestone: LearningMilestone,
-                                   context: Dict[str, any]) -> bool:
-        """Check if milestone requirements are met"""
+                                   season: str,
+                                   cultural_focus: Optional[str]) -> bool:
+        """Check if milestone requirements are met
+        
+        ``counters`` is the (lessons_completed, current_streak, perfect_scores,
+        cultural_events_participated) snapshot taken in update_child_progress.
+        """
+        lessons_completed, current_streak, perfect_scores, _ = counters
         requirements = milestone.requirements
         
         if "lessons_completed" in requirements:
-            if progress.lessons_completed < requirements["lessons_completed"]:
+            if lessons_completed < requirements["lessons_completed"]:
                 return False
                 
         if "current_streak" in requirements:
-            if progress.current_streak < requirements["current_streak"]:
+            if current_streak < requirements["current_streak"]:
                 return False
                 
         if "perfect_scores" in requirements:
-            if progress.perfect_scores < requirements["perfect_scores"]:
+            if perfect_scores < requirements["perfect_scores"]:
                 return False
                 
         if "cultural_focus" in requirements:
             # This would need additional tracking in a real implementation
-            if context.get("cultural_focus") != requirements["cultural_focus"]:
+            if cultural_focus != requirements["cultural_focus"]:
                 return False
                 
         if "season" in requirements:
-            current_season = context.get("season", "spring")
-            if current_season != requirements["season"]:
+            if season != requirements["season"]:
                 return False
         
         return True
 
     def _check_unlock_requirements(self, 
-                                 progress: ChildProgress, 
+                                 counters: Tuple[int, int, int, int], 
                                  item: CustomizationItem,
-                                 context: Dict[str, any]) -> bool:
-        """Check if item unlock requirements are met"""
+                                 season: str,
+                                 current_celebration: Optional[str],
+                                 participation: bool) -> bool:
+        """Check if item unlock requirements are met
+        
+        ``counters`` has the same layout as in _check_milestone_requirements.
+        """
+        lessons_completed, current_streak, perfect_scores, _ = counters
         requirements = item.unlock_requirements
+        unlock_condition = item.unlock_condition
         
-        if item.unlock_condition == UnlockCondition.LESSON_COMPLETED:
-            return progress.lessons_completed >= requirements.get("lessons_count", 1)
+        # Enum members are singletons, so identity checks are sufficient here
+        if unlock_condition is UnlockCondition.LESSON_COMPLETED:
+            return lessons_completed >= requirements.get("lessons_count", 1)
             
-        elif item.unlock_condition == UnlockCondition.STREAK_ACHIEVED:
+        elif unlock_condition is UnlockCondition.STREAK_ACHIEVED:
             streak_req = requirements.get("streak_length", 3)
             season_req = requirements.get("season")
             if season_req:
-                current_season = context.get("season", "spring")
-                return (progress.current_streak >= streak_req and 
-                       current_season == season_req)
-            return progress.current_streak >= streak_req
+                return (current_streak >= streak_req and 
+                       season == season_req)
+            return current_streak >= streak_req
             
-        elif item.unlock_condition == UnlockCondition.PERFECT_SCORE:
-            return progress.perfect_scores >= requirements.get("perfect_scores", 1)
+        elif unlock_condition is UnlockCondition.PERFECT_SCORE:
+            return perfect_scores >= requirements.get("perfect_scores", 1)
             
-        elif item.unlock_condition == UnlockCondition.SEASONAL_EVENT:
-            current_season = context.get("season", "spring")
+        elif unlock_condition is UnlockCondition.SEASONAL_EVENT:
             season_req = requirements.get("season")
             lessons_req = requirements.get("lessons_in_season", 1)
-            if season_req == current_season:
+            if season_req == season:
                 # In a real implementation, would track lessons per season
-                return progress.lessons_completed >= lessons_req
+                return lessons_completed >= lessons_req
             return False
             
-        elif item.unlock_condition == UnlockCondition.CULTURAL_CELEBRATION:
+        elif unlock_condition is UnlockCondition.CULTURAL_CELEBRATION:
             celebration = requirements.get("celebration")
-            current_celebration = context.get("current_celebration")
             return (celebration == current_celebration and 
-                   context.get("participation", False))
+                   participation)
         
         return False
 
@@ -488,35 +740,45 @@ class CharacterCustomizationService:
             }
         
         item = self.customization_items[item_id]
-        category = item.category.value
+        category = item._category_value
+        slot = item._category_idx
         
         # Unequip previous item in same category if any
-        old_item_id = progress.equipped_items.get(category)
+        old_item_id = progress.equipped_items[slot]
         
         # Equip new item
-        progress.equipped_items[category] = item_id
+        progress.equipped_items[slot] = item_id
+        self.child_progress_store[child_id] = progress
         
         return {
             "success": True,
             "equipped_item": item.to_dict(),
             "previous_item": old_item_id,
             "category": category,
-            "visual_config": item.visual_config
+            "visual_config": _copy_config(item.visual_config)
         }
 
     def get_child_customization_state(self, child_id: str) -> Dict[str, any]:
         """Get complete customization state for a child"""
         progress = self.register_child(child_id)
         
-        unlocked_items = {
-            item_id: self.customization_items[item_id].to_dict()
-            for item_id in progress.unlocked_items
-            if item_id in self.customization_items
-        }
+        # Reuse the resolved unlocked items until something new is unlocked;
+        # the dicts handed out are built fresh so callers may edit them
+        cached_view = progress._unlocked_view
+        if cached_view is not None and cached_view[0] == progress.unlock_version:
+            resolved_items = cached_view[1]
+        else:
+            resolved_items = tuple(
+                self.customization_items[item_id]
+                for item_id in progress.unlocked_items
+                if item_id in self.customization_items
+            )
+            progress._unlocked_view = (progress.unlock_version, resolved_items)
+        unlocked_items = {item.item_id: item.to_dict() for item in resolved_items}
         
         equipped_items = {
             category: self.customization_items[item_id].to_dict()
-            for category, item_id in progress.equipped_items.items()
+            for category, item_id in zip(CATEGORY_LABELS, progress.equipped_items)
             if item_id in self.customization_items
         }
         
@@ -529,7 +791,7 @@ class CharacterCustomizationService:
                 milestone_id: {
                     "name": milestone.name,
                     "description": milestone.description,
-                    "requirements": milestone.requirements,
+                    "requirements": dict(milestone.requirements),
                     "achieved": milestone_id in progress.milestones_achieved
                 }
                 for milestone_id, milestone in self.learning_milestones.items()
@@ -545,10 +807,10 @@ class CharacterCustomizationService:
             "customizations": {}
         }
         
-        for category, item_id in progress.equipped_items.items():
+        for category, item_id in zip(CATEGORY_LABELS, progress.equipped_items):
             if item_id in self.customization_items:
                 item = self.customization_items[item_id]
-                visual_config["customizations"][category] = item.visual_config
+                visual_config["customizations"][category] = _copy_config(item.visual_config)
         
         return visual_config
 
@@ -556,12 +818,10 @@ class CharacterCustomizationService:
         """Get seasonal customization recommendations"""
         seasonal_items = []
         
-        for item in self.customization_items.values():
-            if (item.seasonal_availability and 
-                season in item.seasonal_availability):
-                seasonal_items.append({
-                    "item": item.to_dict(),
-                    "unlock_hint": f"Complete {item.unlock_requirements} to unlock this {season} item!"
-                })
+        for item in self._items_by_season.get(season, ()):
+            seasonal_items.append({
+                "item": item.to_dict(),
+                "unlock_hint": f"Complete {item.unlock_requirements} to unlock this {season} item!"
+            })
         
         return seasonal_items
\ No newline at end of file
@@ -6,9 +6,13 @@ Integrates with Xiao Mei character service and scenario generation for natural c
 """
 
 import asyncio
+import random
+import sys
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from array import array
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, AsyncGenerator, Awaitable, Callable, Set, Tuple
 from enum import Enum
 
 from .conversation_types import ScenarioType, ConversationPhase, ConversationTurn, ScenarioSession
@@ -16,6 +20,12 @@ from .scenario_generation import ScenarioGenerationService
 from .encouragement_system import BilingualPraiseEngine, PersonalJourneyNarrative
 from .trauma_validation import NonCompetitiveLanguageFilter
 
+# asyncio.timeout is 3.11+; async-timeout provides the same context manager on 3.10
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
 
 class FlowState(str, Enum):
     """States in the conversation flow"""
@@ -27,6 +37,13 @@ class FlowState(str, Enum):
     ENCOURAGING_FEEDBACK = "encouraging_feedback"
     COMPLETED = "completed"
 
+    def __new__(cls, value: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        # Declaration order, the state buffer code
+        member.ordinal = len(cls.__members__)
+        return member
+
 
 class ChildResponseType(str, Enum):
     """Types of child responses"""
@@ -36,7 +53,7 @@ class ChildResponseType(str, Enum):
     SUCCESS = "success"
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowConfiguration:
     """Configuration for conversation flow timing and behavior"""
     transition_pause_ms: int = 1000  # 1 second pause
@@ -47,7 +64,7 @@ class FlowConfiguration:
     gentle_wait_prompt_interval_ms: int = 30000  # Gentle prompt every 30s if still waiting
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowResult:
     """Result of a conversation flow execution"""
     success: bool
@@ -61,179 +78,428 @@ class FlowResult:
     completed_successfully: bool
 
 
+# Phases used on hot paths, resolved once instead of a global + attribute lookup per use
+_CHINESE_COMFORT = ConversationPhase.CHINESE_COMFORT
+_ENGLISH_DEMONSTRATION = ConversationPhase.ENGLISH_DEMONSTRATION
+_CHILD_PRACTICE = ConversationPhase.CHILD_PRACTICE
+_ENCOURAGING_FEEDBACK = ConversationPhase.ENCOURAGING_FEEDBACK
+
+# Flow states are stored as one byte per slot in ConversationFlowService._state_buf,
+# coded by FlowState.ordinal
+_STATE_BY_CODE = tuple(FlowState)
+
+# Scenario-specific celebrations; str-enum keys also match raw scenario values
+_CELEBRATION_TEXTS: Dict[ScenarioType, str] = {
+    ScenarioType.INTRODUCING_YOURSELF: "太好了! (Tài hǎo le!) You introduced yourself brilliantly!",
+    ScenarioType.ASKING_FOR_TOILET: "很好! (Hěn hǎo!) Perfect way to ask for the toilet!",
+    ScenarioType.ASKING_FOR_HELP: "真棒! (Zhēn bàng!) You asked for help so politely!",
+    ScenarioType.EXPRESSING_HUNGER: "好极了! (Hǎo jí le!) Great way to say you're hungry!",
+    ScenarioType.SAYING_GOODBYE: "完美! (Wánměi!) Perfect goodbye! So polite!"
+}
+
+
+# Failed flows differ only in scenario, child, progress and duration
+_ERROR_FLOW_RESULT = FlowResult(
+    success=False,
+    scenario_type=ScenarioType.INTRODUCING_YOURSELF,
+    child_id="",
+    session_id="",
+    turns_completed=0,
+    total_duration_ms=0,
+    child_response_type=ChildResponseType.UNEXPECTED,
+    encouragement_given="That's okay, let's try together!",
+    completed_successfully=False
+)
+
+# Offered while the child is still thinking; only the timestamp varies per prompt
+_GENTLE_PROMPT = ConversationTurn(
+    phase=_ENCOURAGING_FEEDBACK,
+    speaker="xiao_mei",
+    content="慢慢来 (Màn màn lái) - take your time, I'm here with you",
+    language="mixed",
+    timestamp=0.0,
+    encouragement_level="gentle"
+)
+
+
+# The language helpers hold only constant phrase tables, so every service shares one set.
+# Sharing the filter also means _compose_encouragement entries (keyed by its bound clean)
+# are reused across services instead of duplicated per instance.
+_PRAISE_ENGINE = BilingualPraiseEngine()
+_JOURNEY_NARRATIVE = PersonalJourneyNarrative()
+_NON_COMPETITIVE_FILTER = NonCompetitiveLanguageFilter()
+
+
+@lru_cache(maxsize=256)
+def _compose_encouragement(clean: Callable[[str], str], base: str, tail: str) -> str:
+    """Journey tail plus non-competitive cleanup; stock phrases and tails repeat constantly"""
+    return clean(f"{base} {tail}")
+
+
+def _release_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _sleep_until(loop: asyncio.AbstractEventLoop, deadline: float) -> None:
+    """Suspend until the loop's monotonic clock reaches deadline; no timer if already past"""
+    delay = deadline - loop.time()
+    if delay <= 0:
+        return
+    waiter = loop.create_future()
+    handle = loop.call_later(delay, _release_waiter, waiter)
+    try:
+        await waiter
+    finally:
+        handle.cancel()
+
+
+def _make_turn(phase: ConversationPhase, speaker: str, content: str,
+               language: str, level: str) -> ConversationTurn:
+    """Build a turn stamped with a single wall-clock read"""
+    return ConversationTurn(phase, speaker, content, language, time.time(), level)
+
+
+def _deliver_simulated_child_turn(input_future: asyncio.Future) -> None:
+    """Stand-in for speech input: resolve the pending input with a child attempt"""
+    if not input_future.done():
+        input_future.set_result(_make_turn(
+            _CHILD_PRACTICE, "child", "Hello, my name is...", "en-IE", "standard"
+        ))
+
+
+class GentlePromptScheduler:
+    """One shared timer that tells every flow waiting on a child when a gentle prompt is due"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float):
+        self.loop = loop
+        self.interval = interval
+        # Future handed out by register -> its due time on the loop clock. Keyed per
+        # registration, so flows sharing a session id never clobber each other
+        self.waiting: Dict[asyncio.Future, float] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def register(self) -> asyncio.Future:
+        """Return a future resolved one interval from now, unless unregistered first"""
+        due = self.loop.time() + self.interval
+        prompt_due = self.loop.create_future()
+        self.waiting[prompt_due] = due
+        # Every interval is the same, so an armed timer is never later than this due time
+        if self._handle is None:
+            self._handle = self.loop.call_at(due, self._tick)
+        return prompt_due
+
+    def unregister(self, prompt_due: asyncio.Future) -> None:
+        """Drop a registration; the timer stops once nobody is waiting"""
+        self.waiting.pop(prompt_due, None)
+        if not self.waiting and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _tick(self) -> None:
+        # Each registration is due one interval after it was made, so the
+        # timer is re-armed for the earliest remaining due time
+        now = self.loop.time()
+        next_due = None
+        for prompt_due, due in list(self.waiting.items()):
+            if due <= now:
+                del self.waiting[prompt_due]
+                if not prompt_due.done():
+                    prompt_due.set_result(None)
+            elif next_due is None or due < next_due:
+                next_due = due
+        self._handle = self.loop.call_at(next_due, self._tick) if next_due is not None else None
+
+
 class ConversationFlowService:
     """Service for managing bilingual conversation flows"""
 
     def __init__(self, scenario_service: ScenarioGenerationService):
         self.scenario_service = scenario_service
         self.config = FlowConfiguration()
-        self.active_flows: Dict[str, FlowState] = {}
-        self.praise_engine = BilingualPraiseEngine()
-        self.journey_narrative = PersonalJourneyNarrative()
-        self.non_competitive_filter = NonCompetitiveLanguageFilter()
+        # Active flow states: session_id -> slot, slot -> state code
+        self._session_slot: Dict[str, int] = {}
+        self._state_buf = array('B')
+        self._free_slots: List[int] = []
+        self.praise_engine = _PRAISE_ENGINE
+        self.journey_narrative = _JOURNEY_NARRATIVE
+        self.non_competitive_filter = _NON_COMPETITIVE_FILTER
+        # Strong references keep background flow tasks alive until they finish
+        self._flow_tasks: Set[asyncio.Task] = set()
+        self._prompt_scheduler: Optional[GentlePromptScheduler] = None
+
+    def _postprocess(self, text: str) -> str:
+        """Same result as clean(add_to(text)), memoized per (text, journey tail)"""
+        # The tail is drawn exactly as PersonalJourneyNarrative.add_to draws it
+        tail = random.choice(self.journey_narrative.journey_phrases)
+        return _compose_encouragement(self.non_competitive_filter.clean, text, tail)
 
     async def execute_scenario_flow(self, 
                                   scenario_type: ScenarioType, 
                                   child_id: str) -> AsyncGenerator[ConversationTurn, None]:
-        """Execute complete bilingual flow for a scenario"""
+        """Execute complete bilingual flow for a scenario, yielding turns as they happen"""
+        # A flow has four turns plus the odd gentle prompt, so an unbounded queue stays tiny
+        turns: asyncio.Queue = asyncio.Queue()
+        producer = self._start_flow(scenario_type, child_id, turns)
+        try:
+            while True:
+                turn = await turns.get()
+                if turn is None:
+                    break
+                yield turn
+            # Surface any error raised by the flow itself
+            await producer
+        finally:
+            producer.cancel()
+
+    async def execute_scenario_flow_queued(self, 
+                                         scenario_type: ScenarioType, 
+                                         child_id: str) -> asyncio.Queue:
+        """Start a flow in the background and return the queue its turns arrive on
+        
+        The queue ends with None, also when the flow fails; the error then goes to
+        the event loop's exception handler. Drain it with
+        `while (turn := await turns.get()) is not None: ...`
+        """
+        # Bounded so a slow consumer still applies backpressure to the flow
+        turns: asyncio.Queue = asyncio.Queue(maxsize=4)
+        self._start_flow(scenario_type, child_id, turns)
+        return turns
+
+    def _start_flow(self, 
+                    scenario_type: ScenarioType, 
+                    child_id: str,
+                    turns: asyncio.Queue) -> asyncio.Task:
+        """Run a flow as a task that feeds its turns into the queue, then None"""
+        async def produce() -> None:
+            try:
+                await self._run_flow(scenario_type, child_id, emit=turns.put)
+            except asyncio.CancelledError:
+                # A cancelled flow has nobody left waiting on its terminator
+                raise
+            except Exception:
+                await turns.put(None)
+                raise
+            await turns.put(None)
+        
+        task = asyncio.ensure_future(produce())
+        self._flow_tasks.add(task)
+        task.add_done_callback(self._flow_tasks.discard)
+        return task
+
+    def _acquire_slot(self, session_id: str) -> int:
+        """Allocate a state slot for a new flow; the flow owns it until released"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._state_buf)
+            self._state_buf.append(0)
+        self._session_slot[session_id] = slot
+        return slot
+
+    def _release_slot(self, session_id: str, slot: int) -> None:
+        """Return a flow's slot, unmapping the session if a newer flow has not taken it"""
+        # One pop in the common case; put back the rare newer flow's mapping
+        owner = self._session_slot.pop(session_id, slot)
+        if owner != slot:
+            self._session_slot[session_id] = owner
+        self._free_slots.append(slot)
+
+    async def _run_flow(self, 
+                      scenario_type: ScenarioType, 
+                      child_id: str,
+                      emit: Optional[Callable[[ConversationTurn], Awaitable[None]]] = None
+                      ) -> Tuple[int, Optional[ConversationTurn]]:
+        """Run the flow phases, passing each turn to emit if given
+        
+        Returns:
+            (turns_completed, last_turn) for the flow
+        """
+        
+        # Bind what each phase touches once; the flow body is straight-line code
+        scenario_service = self.scenario_service
+        add_turn = scenario_service.add_turn_to_session
+        config = self.config
         
         # Create scenario session
-        session = self.scenario_service.create_scenario_session(scenario_type, child_id)
-        if not session:
+        session = scenario_service.create_scenario_session(scenario_type, child_id)
+        if session is None:
             raise ValueError(f"Could not create session for scenario {scenario_type}")
         
         session_id = session.session_id
-        self.active_flows[session_id] = FlowState.INITIALIZING
+        slot = self._acquire_slot(session_id)
+        state_buf = self._state_buf
+        state_buf[slot] = FlowState.INITIALIZING.ordinal
+        turns_completed = 0
+        last_turn = None
+        
+        # Pauses are deadlines on the loop's monotonic clock, fixed before each
+        # turn is handed to the consumer, so consumer time counts toward them
+        loop = asyncio.get_running_loop()
         
         try:
             # Phase 1: Chinese Comfort
-            self.active_flows[session_id] = FlowState.CHINESE_COMFORT
-            chinese_turn = self.scenario_service.get_chinese_comfort_phase(scenario_type)
+            state_buf[slot] = FlowState.CHINESE_COMFORT.ordinal
+            chinese_turn = scenario_service.get_chinese_comfort_phase(scenario_type)
+            pause_deadline = loop.time() + config.transition_pause_ms / 1000.0
             if chinese_turn:
-                self.scenario_service.add_turn_to_session(session_id, chinese_turn)
-                yield chinese_turn
+                add_turn(session_id, chinese_turn)
+                turns_completed += 1
+                last_turn = chinese_turn
+                if emit is not None:
+                    await emit(chinese_turn)
             
             # Phase 2: Transition Pause
-            self.active_flows[session_id] = FlowState.TRANSITION_PAUSE
-            await asyncio.sleep(self.config.transition_pause_ms / 1000.0)
+            state_buf[slot] = FlowState.TRANSITION_PAUSE.ordinal
+            await _sleep_until(loop, pause_deadline)
             
             # Phase 3: English Demonstration
-            self.active_flows[session_id] = FlowState.ENGLISH_DEMONSTRATION
-            english_turn = self.scenario_service.get_english_demonstration_phase(scenario_type)
+            state_buf[slot] = FlowState.ENGLISH_DEMONSTRATION.ordinal
+            english_turn = scenario_service.get_english_demonstration_phase(scenario_type)
             if english_turn:
-                self.scenario_service.add_turn_to_session(session_id, english_turn)
-                yield english_turn
+                add_turn(session_id, english_turn)
+                turns_completed += 1
+                last_turn = english_turn
+                if emit is not None:
+                    await emit(english_turn)
             
             # Phase 4: Patient Waiting for Child Response
-            self.active_flows[session_id] = FlowState.WAITING_FOR_CHILD
-            child_turn = await self._wait_for_child_response(session_id)
+            state_buf[slot] = FlowState.WAITING_FOR_CHILD.ordinal
+            if config.patient_waiting:
+                child_turn = await self._wait_for_child_response(session_id, loop, emit)
+            else:
+                # Without patient waiting there is nothing to await
+                child_turn = None
+            pause_deadline = loop.time() + config.encouragement_pause_ms / 1000.0
             if child_turn:
-                self.scenario_service.add_turn_to_session(session_id, child_turn)
-                yield child_turn
+                add_turn(session_id, child_turn)
+                turns_completed += 1
+                last_turn = child_turn
+                if emit is not None:
+                    await emit(child_turn)
             
-            # Phase 5: Encouraging Feedback
-            self.active_flows[session_id] = FlowState.ENCOURAGING_FEEDBACK
-            feedback_turn = await self._generate_encouraging_feedback(session_id, child_turn)
+            # Phase 5: Encouraging Feedback (after a brief pause)
+            state_buf[slot] = FlowState.ENCOURAGING_FEEDBACK.ordinal
+            await _sleep_until(loop, pause_deadline)
+            feedback_turn = self._generate_encouraging_feedback(session_id, child_turn)
             if feedback_turn:
-                self.scenario_service.add_turn_to_session(session_id, feedback_turn)
-                yield feedback_turn
+                add_turn(session_id, feedback_turn)
+                turns_completed += 1
+                last_turn = feedback_turn
+                if emit is not None:
+                    await emit(feedback_turn)
             
             # Mark as completed
-            self.active_flows[session_id] = FlowState.COMPLETED
-            self.scenario_service.complete_session(session_id)
+            state_buf[slot] = FlowState.COMPLETED.ordinal
+            scenario_service.complete_session(session_id)
             
         finally:
             # Clean up active flow tracking
-            if session_id in self.active_flows:
-                del self.active_flows[session_id]
+            self._release_slot(session_id, slot)
+        
+        return turns_completed, last_turn
+
+    async def _wait_for_child_response(self, 
+                                     session_id: str,
+                                     loop: asyncio.AbstractEventLoop,
+                                     emit: Optional[Callable[[ConversationTurn], Awaitable[None]]] = None
+                                     ) -> Optional[ConversationTurn]:
+        """Wait patiently for child response, treating no answer in time as silence"""
+        try:
+            async with async_timeout(self.config.child_wait_timeout_ms / 1000.0):
+                return await self._recv_child_turn(session_id, loop, emit)
+        except asyncio.TimeoutError:
+            # Silence gets the same gentle encouragement as any other answer
+            return None
 
-    async def _wait_for_child_response(self, session_id: str) -> Optional[ConversationTurn]:
-        """Wait patiently for child response without time pressure"""
+    async def _recv_child_turn(self, 
+                             session_id: str,
+                             loop: asyncio.AbstractEventLoop,
+                             emit: Optional[Callable[[ConversationTurn], Awaitable[None]]] = None
+                             ) -> ConversationTurn:
+        """Await the child's turn, offering a gentle prompt at each quiet interval"""
         
-        # In real implementation, this would wait for actual speech input
-        # For now, simulate patient waiting behavior
+        # In real implementation, speech input would resolve this future
+        # For now, simulate the child attempting the phrase after some think time
+        input_future = loop.create_future()
+        think_handle = loop.call_later(2.0, _deliver_simulated_child_turn, input_future)
+        prompts = self._gentle_prompts(loop)
+        prompt_due = None
         
-        if self.config.patient_waiting:
-            # Simulate patient waiting - no timeout pressure
-            start_wait = time.time()
-            last_prompt_time = start_wait
-            
-            # Simulated loop: in real system, we'd await actual input events
-            await asyncio.sleep(2.0)  # initial think time
-            
-            # Check if we should give a gentle prompt
-            now = time.time()
-            if (now - last_prompt_time) * 1000 >= self.config.gentle_wait_prompt_interval_ms:
-                last_prompt_time = now
-                gentle_prompt = ConversationTurn(
-                    phase=ConversationPhase.ENCOURAGING_FEEDBACK,
-                    speaker="xiao_mei",
-                    content="慢慢来 (Màn màn lái) - take your time, I'm here with you",
-                    language="mixed",
-                    timestamp=time.time(),
-                    encouragement_level="gentle"
-                )
-                # In a real pipeline we would emit this prompt; here we just proceed
-                _ = gentle_prompt
-            
-            # Simulate child attempting the phrase subsequently
-            simulated_response = "Hello, my name is..."
-            return ConversationTurn(
-                phase=ConversationPhase.CHILD_PRACTICE,
-                speaker="child",
-                content=simulated_response,
-                language="en-IE",
-                timestamp=time.time(),
-                encouragement_level="standard"
+        try:
+            while True:
+                prompt_due = prompts.register()
+                await asyncio.wait((input_future, prompt_due), return_when=asyncio.FIRST_COMPLETED)
+                if input_future.done():
+                    return input_future.result()
+                # Reassure a child who is still thinking, both in the transcript
+                # and to whoever is consuming the flow
+                prompt = replace(_GENTLE_PROMPT, timestamp=time.time())
+                self.scenario_service.add_turn_to_session(session_id, prompt)
+                if emit is not None:
+                    await emit(prompt)
+        finally:
+            if prompt_due is not None:
+                prompts.unregister(prompt_due)
+                prompt_due.cancel()
+            think_handle.cancel()
+            input_future.cancel()
+
+    def _gentle_prompts(self, loop: asyncio.AbstractEventLoop) -> GentlePromptScheduler:
+        """The prompt scheduler shared by all flows on this loop"""
+        scheduler = self._prompt_scheduler
+        if scheduler is None or scheduler.loop is not loop:
+            scheduler = GentlePromptScheduler(
+                loop, self.config.gentle_wait_prompt_interval_ms / 1000.0
             )
-        
-        return None
+            self._prompt_scheduler = scheduler
+        return scheduler
 
-    async def _generate_encouraging_feedback(self, 
-                                           session_id: str, 
-                                           child_turn: Optional[ConversationTurn]) -> Optional[ConversationTurn]:
+    def _generate_encouraging_feedback(self, 
+                                     session_id: str, 
+                                     child_turn: Optional[ConversationTurn]) -> Optional[ConversationTurn]:
         """Generate encouraging feedback regardless of child's response quality"""
         
-        # Brief pause before encouragement
-        await asyncio.sleep(self.config.encouragement_pause_ms / 1000.0)
-        
         # Always provide positive encouragement - trauma-informed approach
         if child_turn:
             # Child attempted - celebrate the effort
             encouragement = self.praise_engine.generate_bilingual_praise()
-            encouragement = self.journey_narrative.add_to(encouragement)
         else:
             # Child was silent - gentle encouragement
             encouragement = "没关系 (Méi guānxi) - that's okay! Let's try together. You're learning!"
-            encouragement = self.journey_narrative.add_to(encouragement)
-        encouragement = self.non_competitive_filter.clean(encouragement)
+        encouragement = self._postprocess(encouragement)
         
-        return ConversationTurn(
-            phase=ConversationPhase.ENCOURAGING_FEEDBACK,
-            speaker="xiao_mei",
-            content=encouragement,
-            language="mixed",  # Chinese + English encouragement
-            timestamp=time.time(),
-            encouragement_level="enthusiastic"
+        # Chinese + English encouragement
+        return _make_turn(
+            _ENCOURAGING_FEEDBACK, "xiao_mei", encouragement, "mixed", "enthusiastic"
         )
 
     def create_simple_success_celebration(self, scenario_type: ScenarioType) -> ConversationTurn:
         """Create a simple success celebration response"""
-        celebrations = {
-            ScenarioType.INTRODUCING_YOURSELF: "太好了! (Tài hǎo le!) You introduced yourself brilliantly!",
-            ScenarioType.ASKING_FOR_TOILET: "很好! (Hěn hǎo!) Perfect way to ask for the toilet!",
-            ScenarioType.ASKING_FOR_HELP: "真棒! (Zhēn bàng!) You asked for help so politely!",
-            ScenarioType.EXPRESSING_HUNGER: "好极了! (Hǎo jí le!) Great way to say you're hungry!",
-            ScenarioType.SAYING_GOODBYE: "完美! (Wánměi!) Perfect goodbye! So polite!"
-        }
-        
-        celebration_text = celebrations.get(
-            scenario_type, 
-            self.praise_engine.generate_bilingual_praise()
-        )
-        celebration_text = self.journey_narrative.add_to(celebration_text)
-        celebration_text = self.non_competitive_filter.clean(celebration_text)
+        celebration_text = _CELEBRATION_TEXTS.get(scenario_type)
+        if celebration_text is None:
+            # Scenarios added without a dedicated celebration get general praise
+            celebration_text = self.praise_engine.generate_bilingual_praise()
+        celebration_text = self._postprocess(celebration_text)
         
-        return ConversationTurn(
-            phase=ConversationPhase.ENCOURAGING_FEEDBACK,
-            speaker="xiao_mei",
-            content=celebration_text,
-            language="mixed",
-            timestamp=time.time(),
-            encouragement_level="enthusiastic"
+        return _make_turn(
+            _ENCOURAGING_FEEDBACK, "xiao_mei", celebration_text, "mixed", "enthusiastic"
         )
 
     def get_flow_state(self, session_id: str) -> Optional[FlowState]:
         """Get current flow state for a session"""
-        return self.active_flows.get(session_id)
+        slot = self._session_slot.get(session_id)
+        if slot is None:
+            return None
+        return _STATE_BY_CODE[self._state_buf[slot]]
 
     def is_flow_active(self, session_id: str) -> bool:
         """Check if a flow is currently active"""
-        return session_id in self.active_flows
+        return session_id in self._session_slot
 
     def get_active_flows_count(self) -> int:
         """Get count of currently active flows"""
-        return len(self.active_flows)
+        return len(self._session_slot)
 
     def configure_timing(self, 
                         transition_pause_ms: Optional[int] = None,
@@ -253,16 +519,16 @@ class ConversationFlowService:
 
     async def execute_simple_flow(self, scenario_type: ScenarioType, child_id: str) -> FlowResult:
         """Execute a simple conversation flow and return results"""
-        start_time = time.time()
+        # Durations come from the loop's monotonic clock, not wall-clock time
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         turns_completed = 0
         
         try:
-            turns = []
-            async for turn in self.execute_scenario_flow(scenario_type, child_id):
-                turns.append(turn)
-                turns_completed += 1
+            # Run the phases directly; no generator needed when nothing streams
+            turns_completed, last_turn = await self._run_flow(scenario_type, child_id)
             
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((loop.time() - start_time) * 1000)
             
             # Determine response type based on turns
             child_response_type = ChildResponseType.SUCCESS
@@ -270,7 +536,7 @@ class ConversationFlowService:
                 child_response_type = ChildResponseType.SILENCE
             
             # Get final encouragement
-            encouragement = turns[-1].content if turns else "Good effort!"
+            encouragement = last_turn.content if last_turn is not None else "Good effort!"
             
             return FlowResult(
                 success=True,
@@ -285,17 +551,13 @@ class ConversationFlowService:
             )
             
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            return FlowResult(
-                success=False,
+            duration_ms = int((loop.time() - start_time) * 1000)
+            return replace(
+                _ERROR_FLOW_RESULT,
                 scenario_type=scenario_type,
                 child_id=child_id,
-                session_id="",
                 turns_completed=turns_completed,
-                total_duration_ms=duration_ms,
-                child_response_type=ChildResponseType.UNEXPECTED,
-                encouragement_given="That's okay, let's try together!",
-                completed_successfully=False
+                total_duration_ms=duration_ms
             )
 
     def validate_bilingual_pattern(self, turns: List[ConversationTurn]) -> Dict[str, Any]:
@@ -310,30 +572,29 @@ class ConversationFlowService:
                 "follows_pattern": False
             }
         
-        # Check for Chinese comfort first
+        first, second = turns[0], turns[1]
         has_chinese_first = (
-            len(turns) > 0 and 
-            turns[0].language == "zh-CN" and 
-            turns[0].phase == ConversationPhase.CHINESE_COMFORT
+            first.language == "zh-CN" and 
+            first.phase == _CHINESE_COMFORT
         )
-        
-        # Check for English demonstration second
         has_english_demo = (
-            len(turns) > 1 and 
-            turns[1].language == "en-IE" and 
-            turns[1].phase == ConversationPhase.ENGLISH_DEMONSTRATION
+            second.language == "en-IE" and 
+            second.phase == _ENGLISH_DEMONSTRATION
         )
         
-        # Check for encouraging feedback
-        has_encouragement = any(
-            turn.phase == ConversationPhase.ENCOURAGING_FEEDBACK 
-            for turn in turns
-        )
+        # Single pass, stopping at the first encouraging feedback
+        has_encouragement = False
+        encouraging = _ENCOURAGING_FEEDBACK
+        for turn in turns:
+            if turn.phase == encouraging:
+                has_encouragement = True
+                break
         
+        valid = has_chinese_first and has_english_demo
         return {
-            "valid": has_chinese_first and has_english_demo,
+            "valid": valid,
             "has_chinese_comfort": has_chinese_first,
             "has_english_demonstration": has_english_demo,
             "has_encouragement": has_encouragement,
-            "follows_pattern": has_chinese_first and has_english_demo and has_encouragement
+            "follows_pattern": valid and has_encouragement
         }
\ No newline at end of file
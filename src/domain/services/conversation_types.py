@@ -4,7 +4,7 @@ Shared conversation types and enums
 This module contains shared types used across conversation services to avoid circular imports.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
 import time
@@ -27,7 +27,7 @@ class ConversationPhase(str, Enum):
     ENCOURAGING_FEEDBACK = "encouraging_feedback"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConversationTurn:
     """A single turn in the conversation"""
     phase: ConversationPhase
@@ -38,7 +38,7 @@ class ConversationTurn:
     encouragement_level: str = "standard"  # "gentle", "standard", "enthusiastic"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioContent:
     """Content structure for a conversation scenario"""
     scenario_type: ScenarioType
@@ -51,7 +51,7 @@ class ScenarioContent:
     difficulty_level: int = 1  # 1-5 scale
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioSession:
     """A complete scenario conversation session"""
     scenario_type: ScenarioType
@@ -60,8 +60,4 @@ class ScenarioSession:
     turns: List[ConversationTurn]
     started_at: float
     completed: bool = False
-    success_indicators: List[str] = None
-
-    def __post_init__(self):
-        if self.success_indicators is None:
-            self.success_indicators = []
+    success_indicators: List[str] = field(default_factory=list)
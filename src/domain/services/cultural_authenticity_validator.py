@@ -6,8 +6,10 @@ cultural accuracy. Includes cultural sensitivity review and community feedback
 integration for authentic cultural representation.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Any, Pattern, Set, Tuple
 from enum import Enum
 import re
 from .cultural_representation import CulturalRepresentationService
@@ -29,7 +31,45 @@ class CulturalSensitivityLevel(str, Enum):
     EXCELLENT = "excellent"
 
 
-@dataclass
+# Contribution of each sensitivity level to the overall authenticity score
+_SENSITIVITY_SCORES: Dict[CulturalSensitivityLevel, float] = {
+    CulturalSensitivityLevel.EXCELLENT: 0.3,
+    CulturalSensitivityLevel.APPROPRIATE: 0.2,
+    CulturalSensitivityLevel.NEEDS_REVIEW: 0.1,
+    CulturalSensitivityLevel.PROBLEMATIC: 0.0
+}
+
+
+# Guidelines handed out as-is; read-only so every caller can share one copy
+_AUTHENTICITY_GUIDELINES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "dublin_authenticity": (
+        "Use correct Dublin location names and descriptions",
+        "Include authentic Irish cultural practices",
+        "Reference real Dublin activities and experiences",
+        "Avoid common misconceptions about Dublin locations"
+    ),
+    "irish_cultural_sensitivity": (
+        "Respect Irish cultural traditions and practices",
+        "Avoid Irish stereotypes and clichés",
+        "Include positive Irish cultural elements",
+        "Ensure authentic Irish social interaction patterns"
+    ),
+    "bicultural_balance": (
+        "Maintain Chinese heritage pride and identity",
+        "Encourage positive Irish cultural integration",
+        "Create cultural bridge opportunities",
+        "Avoid cultural hierarchy or pressure"
+    ),
+    "age_appropriateness": (
+        "Ensure content is appropriate for target age group",
+        "Include trauma-informed elements",
+        "Maintain child-friendly cultural representation",
+        "Support positive cultural identity development"
+    )
+})
+
+
+@dataclass(slots=True)
 class DublinExpertReviewer:
     """Dublin cultural expert reviewer configuration"""
     name: str
@@ -39,37 +79,179 @@ class DublinExpertReviewer:
     sensitivity_guidelines: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
+class ExpertReview:
+    """Expert review scores (0.0 to 1.0) and comments per review area"""
+    dublin_authenticity_score: float
+    dublin_authenticity_comments: List[str]
+    cultural_sensitivity_score: float
+    cultural_sensitivity_comments: List[str]
+    bicultural_balance_score: float
+    bicultural_balance_comments: List[str]
+    age_appropriateness_score: float
+    age_appropriateness_comments: List[str]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Nested {area: {"score", "comments"}} form of the review"""
+        return {
+            "dublin_authenticity": {
+                "score": self.dublin_authenticity_score,
+                "comments": self.dublin_authenticity_comments
+            },
+            "cultural_sensitivity": {
+                "score": self.cultural_sensitivity_score,
+                "comments": self.cultural_sensitivity_comments
+            },
+            "bicultural_balance": {
+                "score": self.bicultural_balance_score,
+                "comments": self.bicultural_balance_comments
+            },
+            "age_appropriateness": {
+                "score": self.age_appropriateness_score,
+                "comments": self.age_appropriateness_comments
+            }
+        }
+
+
+@dataclass(slots=True)
 class CulturalValidationResult:
     """Result of cultural authenticity validation"""
     authenticity_score: float  # 0.0 to 1.0
     sensitivity_check: CulturalSensitivityLevel
     community_feedback: List[str]
-    expert_review: Dict[str, Any]
+    expert_review: Optional[ExpertReview]  # None when the level skips expert review
     issues_found: List[str]
     strengths_identified: List[str]
     recommendations: List[str]
     validation_level: ValidationLevel
 
 
-@dataclass
+@dataclass(slots=True)
 class CulturalSensitivityChecker:
-    """Cultural sensitivity validation configuration"""
-    problematic_patterns: List[str]
-    positive_indicators: List[str]
-    bicultural_balance_indicators: List[str]
-    age_appropriateness_indicators: List[str]
-    trauma_informed_indicators: List[str]
+    """Cultural sensitivity validation configuration (patterns match lowercased content)"""
+    problematic_patterns: List[Pattern[str]]
+    positive_indicators: List[Pattern[str]]
+    bicultural_balance_indicators: List[Pattern[str]]
+    age_appropriateness_indicators: List[Pattern[str]]
+    trauma_informed_indicators: List[Pattern[str]]
+
+
+@dataclass(slots=True)
+class ContentScan:
+    """Everything the validation passes read from one scenario, gathered in one scan"""
+    content_lower: str
+    problematic_patterns: List[str]  # sources of the problematic patterns found, in checker order
+    positive_count: int
+    bicultural_count: int
+    age_count: int
+    trauma_count: int
+    dublin_locations: List[str]  # correct names of referenced Dublin locations
+    irish_practice_elements: List[str]  # authentic Irish practice elements referenced
+    keywords: FrozenSet[str]  # members of _REVIEW_KEYWORDS that occur in the content
+
+
+# Substrings that expert review and community feedback key off
+_REVIEW_KEYWORDS = (
+    "chinese", "heritage", "tradition", "irish", "dublin", "gaa", "both", "bridge", "share",
+    "family", "school", "learning"
+)
+_HERITAGE_KEYWORDS = frozenset(("chinese", "heritage", "tradition"))
+_IRISH_KEYWORDS = frozenset(("irish", "dublin", "gaa"))
+_BRIDGE_KEYWORDS = frozenset(("both", "bridge", "share"))
+_DUBLIN_FAMILY = frozenset(("dublin", "family"))
+_CHINESE_HERITAGE = frozenset(("chinese", "heritage"))
+_SCHOOL_LEARNING = frozenset(("school", "learning"))
+_GAA_OR_IRISH = frozenset(("gaa", "irish"))
+
+
+def _compile_patterns(patterns: List[str]) -> List[Pattern[str]]:
+    """Compile checker patterns once instead of going through re's module cache per search"""
+    return [re.compile(pattern) for pattern in patterns]
+
+
+def _compile_union(patterns: List[Pattern[str]]) -> Pattern[str]:
+    """One alternation over a pattern group, matching wherever any member matches"""
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+
+
+def _compile_indexed_union(patterns: List[Pattern[str]]) -> Pattern[str]:
+    """Alternation whose match.lastgroup ("p<i>") names the member that matched"""
+    return re.compile("|".join(f"(?P<p{index}>{pattern.pattern})" for index, pattern in enumerate(patterns)))
+
+
+def _count_matching(patterns: List[Pattern[str]], union: Pattern[str], content_lower: str) -> int:
+    """How many patterns in the group occur in content; a single scan when none do"""
+    if union.search(content_lower) is None:
+        return 0
+    return sum(1 for pattern in patterns if pattern.search(content_lower))
+
+
+# Maximal runs of word characters; a \bword\b pattern matches exactly when one of them equals word
+_WORD_RE = re.compile(r"\w+")
+_WHOLE_WORD_PATTERN_RE = re.compile(r"\\b(\w+)\\b")
+
+
+def _content_words(content_lower: str) -> Set[str]:
+    """Every whole word in the content, from a single scan"""
+    return set(_WORD_RE.findall(content_lower))
+
+
+@dataclass(frozen=True, slots=True)
+class _IndicatorGroup:
+    """A pattern group split into whole-word literals (set lookups) and true regexes"""
+    words: FrozenSet[str]
+    residual: List[Pattern[str]]
+    residual_union: Pattern[str]
+
+    @classmethod
+    def from_patterns(cls, patterns: List[Pattern[str]]) -> "_IndicatorGroup":
+        words = set()
+        residual = []
+        for pattern in patterns:
+            literal = _WHOLE_WORD_PATTERN_RE.fullmatch(pattern.pattern)
+            if literal:
+                words.add(literal.group(1))
+            else:
+                residual.append(pattern)
+        return cls(frozenset(words), residual, _compile_union(residual))
+
+    def count(self, content_words: Set[str], content_lower: str) -> int:
+        """Number of the group's patterns found in the content"""
+        count = len(self.words & content_words)
+        if self.residual:
+            count += _count_matching(self.residual, self.residual_union, content_lower)
+        return count
+
+
+@dataclass(frozen=True, slots=True)
+class _LocationReference:
+    """A database location flattened to the fields the accuracy check reads"""
+    correct_name: str
+    correct_name_lower: str
+    authentic_activities: Tuple[str, ...]
+    misconceptions: Tuple[Tuple[str, str], ...]  # (lowercased, original)
 
 
 class CulturalAuthenticityValidator:
     """Service for validating cultural authenticity and sensitivity"""
 
+    # Scenarios are revalidated often (batch evaluation, regeneration loops)
+    SCAN_CACHE_SIZE = 1024
+
     def __init__(self, cultural_service: Optional[CulturalRepresentationService] = None):
         self.cultural_service = cultural_service or CulturalRepresentationService()
         self.dublin_expert_reviewers = self._initialize_dublin_experts()
         self.cultural_sensitivity_checker = self._initialize_sensitivity_checker()
+        checker = self.cultural_sensitivity_checker
+        self._problematic_union = _compile_indexed_union(checker.problematic_patterns)
+        self._positive_group = _IndicatorGroup.from_patterns(checker.positive_indicators)
+        self._bicultural_group = _IndicatorGroup.from_patterns(checker.bicultural_balance_indicators)
+        self._age_group = _IndicatorGroup.from_patterns(checker.age_appropriateness_indicators)
+        self._trauma_group = _IndicatorGroup.from_patterns(checker.trauma_informed_indicators)
         self.authenticity_database = self._initialize_authenticity_database()
+        self._build_reference_index()
+        # Keyed by the exact scenario text; scans are read-only, results are built fresh per call
+        self._cached_scan = lru_cache(maxsize=self.SCAN_CACHE_SIZE)(self._scan_scenario)
 
     def _initialize_dublin_experts(self) -> List[DublinExpertReviewer]:
         """Initialize Dublin cultural expert reviewers"""
@@ -160,7 +342,7 @@ class CulturalAuthenticityValidator:
     def _initialize_sensitivity_checker(self) -> CulturalSensitivityChecker:
         """Initialize cultural sensitivity checking configuration"""
         return CulturalSensitivityChecker(
-            problematic_patterns=[
+            problematic_patterns=_compile_patterns([
                 # Irish stereotypes to avoid
                 r"\bleprechaun\b",
                 r"\bpot of gold\b",
@@ -178,8 +360,8 @@ class CulturalAuthenticityValidator:
                 r"\badult.*content\b",
                 r"\bmature.*themes\b",
                 r"\bcomplex.*politics\b"
-            ],
-            positive_indicators=[
+            ]),
+            positive_indicators=_compile_patterns([
                 # Positive Irish cultural elements
                 r"\bgaa\b",
                 r"\bdublin\b",
@@ -196,8 +378,8 @@ class CulturalAuthenticityValidator:
                 r"\bchinese.*traditions\b",
                 r"\bchinese.*values\b",
                 r"\bchinese.*family\b"
-            ],
-            bicultural_balance_indicators=[
+            ]),
+            bicultural_balance_indicators=_compile_patterns([
                 r"\bboth.*cultures\b",
                 r"\bchinese.*and.*irish\b",
                 r"\bcultural.*bridge\b",
@@ -205,8 +387,8 @@ class CulturalAuthenticityValidator:
                 r"\bintegration.*opportunity\b",
                 r"\bcultural.*exchange\b",
                 r"\bsharing.*traditions\b"
-            ],
-            age_appropriateness_indicators=[
+            ]),
+            age_appropriateness_indicators=_compile_patterns([
                 r"\bage.*appropriate\b",
                 r"\bchild.*friendly\b",
                 r"\bfamily.*activity\b",
@@ -217,8 +399,8 @@ class CulturalAuthenticityValidator:
                 r"\b2nd.*class\b",
                 r"\b3rd.*class\b",
                 r"\b4th.*class\b"
-            ],
-            trauma_informed_indicators=[
+            ]),
+            trauma_informed_indicators=_compile_patterns([
                 r"\bgentle\b",
                 r"\bpatient\b",
                 r"\bencouraging\b",
@@ -227,7 +409,7 @@ class CulturalAuthenticityValidator:
                 r"\bcelebrate.*effort\b",
                 r"\bemotional.*safety\b",
                 r"\bcultural.*comfort\b"
-            ]
+            ])
         )
 
     def _initialize_authenticity_database(self) -> Dict[str, Dict[str, Any]]:
@@ -295,26 +477,62 @@ class CulturalAuthenticityValidator:
             }
         }
 
+    def _build_reference_index(self) -> None:
+        """Flatten the nested database into the lookups the hot paths read"""
+        self._dublin_location_keywords: Tuple[Tuple[str, str], ...] = tuple(
+            (location_info["correct_name"].lower(), location_info["correct_name"])
+            for location_info in self.authenticity_database["dublin_locations"].values()
+        )
+        self._irish_element_keywords: Tuple[Tuple[str, str], ...] = tuple(
+            (element.lower(), element)
+            for practice_info in self.authenticity_database["irish_cultural_practices"].values()
+            for element in practice_info["authentic_elements"]
+        )
+        self._location_references: Dict[str, _LocationReference] = {
+            location_key: _LocationReference(
+                correct_name=location_info["correct_name"],
+                correct_name_lower=location_info["correct_name"].lower(),
+                authentic_activities=tuple(location_info["authentic_activities"]),
+                misconceptions=tuple((misconception.lower(), misconception)
+                                     for misconception in location_info["common_misconceptions"])
+            )
+            for location_key, location_info in self.authenticity_database["dublin_locations"].items()
+        }
+        # References are plain substrings; one scan tells whether any can be present
+        self._reference_union = re.compile("|".join(
+            re.escape(keyword)
+            for keyword, _ in self._dublin_location_keywords + self._irish_element_keywords
+        ))
+
     async def validate_cultural_content(self, 
                                       cultural_scenario: str, 
                                       validation_level: ValidationLevel = ValidationLevel.COMPREHENSIVE) -> CulturalValidationResult:
+        """Validate cultural authenticity and sensitivity of content (awaitable form)"""
+        return self.validate_cultural_content_sync(cultural_scenario, validation_level)
+
+    def validate_cultural_content_sync(self, 
+                                       cultural_scenario: str, 
+                                       validation_level: ValidationLevel = ValidationLevel.COMPREHENSIVE) -> CulturalValidationResult:
         """Validate cultural authenticity and sensitivity of content"""
         
+        # Scan the content once (or reuse a recent scan); every pass below reads from it
+        scan = self._cached_scan(cultural_scenario)
+        
         # Basic validation
-        basic_validation = self._perform_basic_validation(cultural_scenario)
+        basic_validation = self._perform_basic_validation(scan)
         
         # Expert review
-        expert_review = {}
+        expert_review = None
         if validation_level in [ValidationLevel.EXPERT, ValidationLevel.COMPREHENSIVE]:
-            expert_review = self._perform_expert_review(cultural_scenario)
+            expert_review = self._perform_expert_review(scan)
         
         # Community feedback simulation
         community_feedback = []
         if validation_level in [ValidationLevel.COMMUNITY, ValidationLevel.COMPREHENSIVE]:
-            community_feedback = self._simulate_community_feedback(cultural_scenario)
+            community_feedback = self._simulate_community_feedback(scan)
         
         # Cultural sensitivity check
-        sensitivity_check = self._perform_sensitivity_check(cultural_scenario)
+        sensitivity_check = self._perform_sensitivity_check(scan)
         
         # Calculate authenticity score
         authenticity_score = self._calculate_authenticity_score(
@@ -337,196 +555,193 @@ class CulturalAuthenticityValidator:
             validation_level=validation_level
         )
 
-    def _perform_basic_validation(self, content: str) -> Dict[str, Any]:
-        """Perform basic cultural authenticity validation"""
-        validation = {
-            "authentic": True,
-            "issues": [],
-            "strengths": []
-        }
+    def validate_cultural_content_batch(self,
+                                        cultural_scenarios: List[str],
+                                        validation_level: ValidationLevel = ValidationLevel.COMPREHENSIVE) -> List[CulturalValidationResult]:
+        """Validate several scenarios in order; repeated texts share a single scan"""
+        validate = self.validate_cultural_content_sync
+        return [validate(cultural_scenario, validation_level) for cultural_scenario in cultural_scenarios]
+
+    def _scan_scenario(self, cultural_scenario: str) -> ContentScan:
+        """Scan a raw scenario (the cached entry point)"""
+        return self._scan_content(cultural_scenario.lower())
+
+    def _scan_content(self, content_lower: str) -> ContentScan:
+        """Collect pattern counts and cultural references from lowercased content"""
+        problematic_patterns = []
+        known_hits = {int(match.lastgroup[1:]) for match in self._problematic_union.finditer(content_lower)}
+        if known_hits:
+            # Every reported member is a hit; one spanning .* match can hide others, so search the rest
+            problematic_patterns = [
+                pattern.pattern
+                for index, pattern in enumerate(self.cultural_sensitivity_checker.problematic_patterns)
+                if index in known_hits or pattern.search(content_lower)
+            ]
         
-        content_lower = content.lower()
+        content_words = _content_words(content_lower)
         
-        # Check for positive cultural indicators
-        positive_indicators = self.cultural_sensitivity_checker.positive_indicators
-        has_positive_elements = any(re.search(pattern, content_lower) for pattern in positive_indicators)
+        dublin_locations = []
+        irish_practice_elements = []
+        if self._reference_union.search(content_lower) is not None:
+            dublin_locations = [
+                name for keyword, name in self._dublin_location_keywords if keyword in content_lower
+            ]
+            irish_practice_elements = [
+                element for keyword, element in self._irish_element_keywords if keyword in content_lower
+            ]
+        
+        return ContentScan(
+            content_lower=content_lower,
+            problematic_patterns=problematic_patterns,
+            positive_count=self._positive_group.count(content_words, content_lower),
+            bicultural_count=self._bicultural_group.count(content_words, content_lower),
+            age_count=self._age_group.count(content_words, content_lower),
+            trauma_count=self._trauma_group.count(content_words, content_lower),
+            dublin_locations=dublin_locations,
+            irish_practice_elements=irish_practice_elements,
+            keywords=frozenset(keyword for keyword in _REVIEW_KEYWORDS if keyword in content_lower)
+        )
+
+    def _perform_basic_validation(self, scan: ContentScan) -> Dict[str, Any]:
+        """Perform basic cultural authenticity validation"""
+        issues = []
+        strengths = []
         
-        if has_positive_elements:
-            validation["strengths"].append("Contains positive cultural references")
+        # Check for positive cultural indicators
+        if scan.positive_count > 0:
+            strengths.append("Contains positive cultural references")
         else:
-            validation["issues"].append("Could include more positive cultural elements")
+            issues.append("Could include more positive cultural elements")
         
         # Check for problematic patterns
-        problematic_patterns = self.cultural_sensitivity_checker.problematic_patterns
-        for pattern in problematic_patterns:
-            if re.search(pattern, content_lower):
-                validation["authentic"] = False
-                validation["issues"].append(f"Contains problematic pattern: {pattern}")
+        issues += [f"Contains problematic pattern: {pattern}" for pattern in scan.problematic_patterns]
         
         # Check Dublin location accuracy
-        dublin_locations = self.authenticity_database["dublin_locations"]
-        for location_key, location_info in dublin_locations.items():
-            if location_info["correct_name"].lower() in content_lower:
-                validation["strengths"].append(f"References authentic Dublin location: {location_info['correct_name']}")
+        strengths += [
+            f"References authentic Dublin location: {location_name}"
+            for location_name in scan.dublin_locations
+        ]
         
-        return validation
+        return {
+            "authentic": not scan.problematic_patterns,
+            "issues": issues,
+            "strengths": strengths
+        }
 
-    def _perform_expert_review(self, content: str) -> Dict[str, Any]:
+    def _perform_expert_review(self, scan: ContentScan) -> ExpertReview:
         """Perform expert review of cultural content"""
-        expert_review = {
-            "dublin_authenticity": {"score": 0.0, "comments": []},
-            "cultural_sensitivity": {"score": 0.0, "comments": []},
-            "bicultural_balance": {"score": 0.0, "comments": []},
-            "age_appropriateness": {"score": 0.0, "comments": []}
-        }
-        
-        content_lower = content.lower()
-        
         # Dublin authenticity review
         dublin_score = 0.0
         dublin_comments = []
         
         # Check for authentic Dublin references
-        dublin_locations = self.authenticity_database["dublin_locations"]
-        for location_key, location_info in dublin_locations.items():
-            if location_info["correct_name"].lower() in content_lower:
-                dublin_score += 0.3
-                dublin_comments.append(f"Authentic reference to {location_info['correct_name']}")
+        for location_name in scan.dublin_locations:
+            dublin_score += 0.3
+            dublin_comments.append(f"Authentic reference to {location_name}")
         
         # Check for Irish cultural practices
-        irish_practices = self.authenticity_database["irish_cultural_practices"]
-        for practice_key, practice_info in irish_practices.items():
-            for element in practice_info["authentic_elements"]:
-                if element.lower() in content_lower:
-                    dublin_score += 0.2
-                    dublin_comments.append(f"Authentic Irish cultural reference: {element}")
-        
-        expert_review["dublin_authenticity"] = {
-            "score": min(dublin_score, 1.0),
-            "comments": dublin_comments
-        }
+        for element in scan.irish_practice_elements:
+            dublin_score += 0.2
+            dublin_comments.append(f"Authentic Irish cultural reference: {element}")
         
         # Cultural sensitivity review
         sensitivity_score = 0.0
         sensitivity_comments = []
         
         # Check for positive indicators
-        positive_indicators = self.cultural_sensitivity_checker.positive_indicators
-        positive_count = sum(1 for pattern in positive_indicators if re.search(pattern, content_lower))
+        positive_count = scan.positive_count
         sensitivity_score += min(positive_count * 0.1, 0.5)
         
         if positive_count > 0:
             sensitivity_comments.append(f"Contains {positive_count} positive cultural indicators")
         
         # Check for bicultural balance
-        bicultural_indicators = self.cultural_sensitivity_checker.bicultural_balance_indicators
-        bicultural_count = sum(1 for pattern in bicultural_indicators if re.search(pattern, content_lower))
+        bicultural_count = scan.bicultural_count
         sensitivity_score += min(bicultural_count * 0.2, 0.3)
         
         if bicultural_count > 0:
             sensitivity_comments.append(f"Shows bicultural balance with {bicultural_count} indicators")
         
-        expert_review["cultural_sensitivity"] = {
-            "score": min(sensitivity_score, 1.0),
-            "comments": sensitivity_comments
-        }
-        
         # Bicultural balance review
         balance_score = 0.0
         balance_comments = []
         
         # Check for Chinese heritage elements
-        if any(word in content_lower for word in ["chinese", "heritage", "tradition"]):
+        if not _HERITAGE_KEYWORDS.isdisjoint(scan.keywords):
             balance_score += 0.4
             balance_comments.append("Includes Chinese heritage elements")
         
         # Check for Irish integration elements
-        if any(word in content_lower for word in ["irish", "dublin", "gaa"]):
+        if not _IRISH_KEYWORDS.isdisjoint(scan.keywords):
             balance_score += 0.4
             balance_comments.append("Includes Irish integration elements")
         
         # Check for cultural bridge elements
-        if any(word in content_lower for word in ["both", "bridge", "share"]):
+        if not _BRIDGE_KEYWORDS.isdisjoint(scan.keywords):
             balance_score += 0.2
             balance_comments.append("Includes cultural bridge elements")
         
-        expert_review["bicultural_balance"] = {
-            "score": min(balance_score, 1.0),
-            "comments": balance_comments
-        }
-        
         # Age appropriateness review
         age_score = 0.0
         age_comments = []
         
         # Check for age-appropriate indicators
-        age_indicators = self.cultural_sensitivity_checker.age_appropriateness_indicators
-        age_count = sum(1 for pattern in age_indicators if re.search(pattern, content_lower))
+        age_count = scan.age_count
         age_score += min(age_count * 0.2, 0.6)
         
         if age_count > 0:
             age_comments.append(f"Contains {age_count} age-appropriate indicators")
         
         # Check for trauma-informed indicators
-        trauma_indicators = self.cultural_sensitivity_checker.trauma_informed_indicators
-        trauma_count = sum(1 for pattern in trauma_indicators if re.search(pattern, content_lower))
+        trauma_count = scan.trauma_count
         age_score += min(trauma_count * 0.1, 0.4)
         
         if trauma_count > 0:
             age_comments.append(f"Contains {trauma_count} trauma-informed indicators")
         
-        expert_review["age_appropriateness"] = {
-            "score": min(age_score, 1.0),
-            "comments": age_comments
-        }
-        
-        return expert_review
+        return ExpertReview(
+            dublin_authenticity_score=min(dublin_score, 1.0),
+            dublin_authenticity_comments=dublin_comments,
+            cultural_sensitivity_score=min(sensitivity_score, 1.0),
+            cultural_sensitivity_comments=sensitivity_comments,
+            bicultural_balance_score=min(balance_score, 1.0),
+            bicultural_balance_comments=balance_comments,
+            age_appropriateness_score=min(age_score, 1.0),
+            age_appropriateness_comments=age_comments
+        )
 
-    def _simulate_community_feedback(self, content: str) -> List[str]:
+    def _simulate_community_feedback(self, scan: ContentScan) -> List[str]:
         """Simulate community feedback for cultural content"""
         feedback = []
-        content_lower = content.lower()
+        keywords = scan.keywords
         
         # Simulate Dublin parent feedback
-        if "dublin" in content_lower and "family" in content_lower:
+        if _DUBLIN_FAMILY <= keywords:
             feedback.append("Dublin parent: 'This accurately represents Dublin family life'")
         
         # Simulate Chinese parent feedback
-        if "chinese" in content_lower and "heritage" in content_lower:
+        if _CHINESE_HERITAGE <= keywords:
             feedback.append("Chinese parent: 'Good to see Chinese heritage being valued'")
         
         # Simulate teacher feedback
-        if "school" in content_lower and "learning" in content_lower:
+        if _SCHOOL_LEARNING <= keywords:
             feedback.append("Irish teacher: 'Content is appropriate for Irish school environment'")
         
         # Simulate cultural expert feedback
-        if "gaa" in content_lower or "irish" in content_lower:
+        if not _GAA_OR_IRISH.isdisjoint(keywords):
             feedback.append("Cultural expert: 'Irish cultural references are authentic and respectful'")
         
         return feedback
 
-    def _perform_sensitivity_check(self, content: str) -> CulturalSensitivityLevel:
+    def _perform_sensitivity_check(self, scan: ContentScan) -> CulturalSensitivityLevel:
         """Perform cultural sensitivity check"""
-        content_lower = content.lower()
-        
         # Check for problematic patterns
-        problematic_patterns = self.cultural_sensitivity_checker.problematic_patterns
-        has_problematic = any(re.search(pattern, content_lower) for pattern in problematic_patterns)
-        
-        if has_problematic:
+        if scan.problematic_patterns:
             return CulturalSensitivityLevel.PROBLEMATIC
         
-        # Check for positive indicators
-        positive_indicators = self.cultural_sensitivity_checker.positive_indicators
-        positive_count = sum(1 for pattern in positive_indicators if re.search(pattern, content_lower))
-        
-        # Check for bicultural balance
-        bicultural_indicators = self.cultural_sensitivity_checker.bicultural_balance_indicators
-        bicultural_count = sum(1 for pattern in bicultural_indicators if re.search(pattern, content_lower))
-        
-        # Check for trauma-informed elements
-        trauma_indicators = self.cultural_sensitivity_checker.trauma_informed_indicators
-        trauma_count = sum(1 for pattern in trauma_indicators if re.search(pattern, content_lower))
+        positive_count = scan.positive_count
+        bicultural_count = scan.bicultural_count
+        trauma_count = scan.trauma_count
         
         # Determine sensitivity level
         if positive_count >= 5 and bicultural_count >= 2 and trauma_count >= 3:
@@ -540,7 +755,7 @@ class CulturalAuthenticityValidator:
 
     def _calculate_authenticity_score(self, 
                                     basic_validation: Dict[str, Any],
-                                    expert_review: Dict[str, Any],
+                                    expert_review: Optional[ExpertReview],
                                     community_feedback: List[str],
                                     sensitivity_check: CulturalSensitivityLevel) -> float:
         """Calculate overall authenticity score"""
@@ -550,26 +765,19 @@ class CulturalAuthenticityValidator:
         
         # Expert review contribution
         expert_score = 0.0
-        if expert_review:
-            expert_scores = [
-                expert_review.get("dublin_authenticity", {}).get("score", 0.0),
-                expert_review.get("cultural_sensitivity", {}).get("score", 0.0),
-                expert_review.get("bicultural_balance", {}).get("score", 0.0),
-                expert_review.get("age_appropriateness", {}).get("score", 0.0)
-            ]
-            expert_score = sum(expert_scores) / len(expert_scores)
+        if expert_review is not None:
+            expert_score = (
+                expert_review.dublin_authenticity_score
+                + expert_review.cultural_sensitivity_score
+                + expert_review.bicultural_balance_score
+                + expert_review.age_appropriateness_score
+            ) / 4
         
         # Community feedback contribution
         community_score = min(len(community_feedback) * 0.1, 0.2)
         
         # Sensitivity check contribution
-        sensitivity_scores = {
-            CulturalSensitivityLevel.EXCELLENT: 0.3,
-            CulturalSensitivityLevel.APPROPRIATE: 0.2,
-            CulturalSensitivityLevel.NEEDS_REVIEW: 0.1,
-            CulturalSensitivityLevel.PROBLEMATIC: 0.0
-        }
-        sensitivity_score = sensitivity_scores.get(sensitivity_check, 0.0)
+        sensitivity_score = _SENSITIVITY_SCORES.get(sensitivity_check, 0.0)
         
         # Calculate final score
         final_score = base_score + (expert_score * 0.4) + community_score + sensitivity_score
@@ -578,7 +786,7 @@ class CulturalAuthenticityValidator:
 
     def _generate_recommendations(self,
                                 basic_validation: Dict[str, Any],
-                                expert_review: Dict[str, Any],
+                                expert_review: Optional[ExpertReview],
                                 community_feedback: List[str],
                                 sensitivity_check: CulturalSensitivityLevel) -> List[str]:
         """Generate recommendations for improving cultural content"""
@@ -592,21 +800,17 @@ class CulturalAuthenticityValidator:
             recommendations.append("Add more positive cultural elements")
         
         # Recommendations based on expert review
-        if expert_review:
-            dublin_score = expert_review.get("dublin_authenticity", {}).get("score", 0.0)
-            if dublin_score < 0.5:
+        if expert_review is not None:
+            if expert_review.dublin_authenticity_score < 0.5:
                 recommendations.append("Include more authentic Dublin cultural references")
             
-            sensitivity_score = expert_review.get("cultural_sensitivity", {}).get("score", 0.0)
-            if sensitivity_score < 0.5:
+            if expert_review.cultural_sensitivity_score < 0.5:
                 recommendations.append("Enhance cultural sensitivity and positive indicators")
             
-            balance_score = expert_review.get("bicultural_balance", {}).get("score", 0.0)
-            if balance_score < 0.5:
+            if expert_review.bicultural_balance_score < 0.5:
                 recommendations.append("Improve bicultural balance and heritage representation")
             
-            age_score = expert_review.get("age_appropriateness", {}).get("score", 0.0)
-            if age_score < 0.5:
+            if expert_review.age_appropriateness_score < 0.5:
                 recommendations.append("Ensure age-appropriate content and trauma-informed approach")
         
         # Recommendations based on sensitivity check
@@ -630,61 +834,37 @@ class CulturalAuthenticityValidator:
             "strengths": []
         }
         
-        location_key = location_name.lower().replace(" ", "_")
-        location_info = self.authenticity_database["dublin_locations"].get(location_key)
+        location_name_lower = location_name.lower()
+        location_key = location_name_lower.replace(" ", "_")
+        reference = self._location_references.get(location_key)
         
-        if not location_info:
+        if reference is None:
             validation["issues"].append(f"Location {location_name} not found in authenticity database")
             return validation
         
         # Check name accuracy
-        if location_info["correct_name"].lower() == location_name.lower():
+        if reference.correct_name_lower == location_name_lower:
             validation["score"] += 0.3
             validation["strengths"].append("Correct location name")
         else:
-            validation["issues"].append(f"Incorrect name: should be {location_info['correct_name']}")
+            validation["issues"].append(f"Incorrect name: should be {reference.correct_name}")
         
         # Check description accuracy
         description_lower = description.lower()
-        if any(activity in description_lower for activity in location_info["authentic_activities"]):
+        if any(activity in description_lower for activity in reference.authentic_activities):
             validation["score"] += 0.4
             validation["strengths"].append("Includes authentic activities")
         else:
             validation["issues"].append("Missing authentic activities for this location")
         
         # Check for misconceptions
-        for misconception in location_info["common_misconceptions"]:
-            if misconception.lower() in description_lower:
+        for misconception_lower, misconception in reference.misconceptions:
+            if misconception_lower in description_lower:
                 validation["issues"].append(f"Contains common misconception: {misconception}")
         
         validation["accurate"] = validation["score"] >= 0.6
         return validation
 
-    def get_cultural_authenticity_guidelines(self) -> Dict[str, List[str]]:
-        """Get guidelines for maintaining cultural authenticity"""
-        return {
-            "dublin_authenticity": [
-                "Use correct Dublin location names and descriptions",
-                "Include authentic Irish cultural practices",
-                "Reference real Dublin activities and experiences",
-                "Avoid common misconceptions about Dublin locations"
-            ],
-            "irish_cultural_sensitivity": [
-                "Respect Irish cultural traditions and practices",
-                "Avoid Irish stereotypes and clichés",
-                "Include positive Irish cultural elements",
-                "Ensure authentic Irish social interaction patterns"
-            ],
-            "bicultural_balance": [
-                "Maintain Chinese heritage pride and identity",
-                "Encourage positive Irish cultural integration",
-                "Create cultural bridge opportunities",
-                "Avoid cultural hierarchy or pressure"
-            ],
-            "age_appropriateness": [
-                "Ensure content is appropriate for target age group",
-                "Include trauma-informed elements",
-                "Maintain child-friendly cultural representation",
-                "Support positive cultural identity development"
-            ]
-        }
+    def get_cultural_authenticity_guidelines(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get guidelines for maintaining cultural authenticity (shared and read-only)"""
+        return _AUTHENTICITY_GUIDELINES
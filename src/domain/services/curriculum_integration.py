@@ -7,7 +7,9 @@ This service handles Irish curriculum integration and age-appropriate content an
 Implements ICurriculumIntegrationService interface for dependency injection.
 """
 
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, ClassVar, FrozenSet, Mapping, Optional, Tuple
 from src.application.interfaces.services import ICurriculumIntegrationService
 
 # Import enums from the original file (will be moved to domain models in Phase 2)
@@ -29,6 +31,13 @@ class VocabularyComplexity(Enum):
     MODERATE = "moderate"              # Ages 7-8: More varied vocabulary
     COMPLEX = "complex"                # Ages 9-10: Advanced vocabulary, longer sentences
 
+    def __new__(cls, value: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        # Declaration order, simplest first, for comparing levels
+        member.ordinal = len(cls.__members__)
+        return member
+
 class IrishCurriculumStage(Enum):
     """Irish Primary School curriculum stages for educational alignment"""
     JUNIOR_INFANTS_STAGE = "junior_infants_stage"      # Ages 4-5: Foundation stage
@@ -66,6 +75,307 @@ class DevelopmentalAppropriateness(Enum):
     TOO_COMPLEX = "too_complex"        # Above child's developmental level
 
 
+# Only Basic Multilingual Plane characters are remembered, which bounds the
+# translate table at 65536 entries however varied the chat text gets
+_NON_WORD_CACHE_LIMIT = 0x10000
+
+
+class _NonWordDeletions(dict):
+    """str.translate table deleting every character but letters and whitespace"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Filled lazily so any Unicode letter survives, as with str.isalpha
+        character = chr(codepoint)
+        mapped = codepoint if character.isalpha() or character.isspace() else None
+        if codepoint < _NON_WORD_CACHE_LIMIT:
+            self[codepoint] = mapped
+        return mapped
+
+
+# Shared by all services; each BMP character is classified once per process
+_NON_WORD_DELETIONS = _NonWordDeletions()
+
+
+def _words(text: str) -> List[str]:
+    """Lowercased words of text with punctuation and digits removed"""
+    # Same words as splitting on whitespace and then stripping non-letters
+    # from each piece, without the per-word pass
+    return text.lower().translate(_NON_WORD_DELETIONS).split()
+
+
+# Enum members by value, for the string-based interface methods
+_AGE_GROUPS_BY_VALUE = MappingProxyType({member.value: member for member in AgeGroup})
+_CURRICULUM_STAGES_BY_VALUE = MappingProxyType({member.value: member for member in IrishCurriculumStage})
+
+# Age-appropriate vocabulary sets (basic implementation)
+_VOCABULARY_BY_COMPLEXITY = MappingProxyType({
+    VocabularyComplexity.VERY_SIMPLE: frozenset({
+        # Ages 4-5: Basic nouns, simple actions, common words
+        'hello', 'hi', 'bye', 'yes', 'no', 'please', 'thank', 'good', 'bad',
+        'big', 'small', 'red', 'blue', 'cat', 'dog', 'mom', 'dad', 'home',
+        'eat', 'play', 'run', 'sit', 'go', 'come', 'look', 'see', 'happy',
+        'sad', 'one', 'two', 'me', 'you', 'up', 'down', 'hot', 'cold'
+    }),
+    VocabularyComplexity.SIMPLE: frozenset({
+        # Ages 5-7: Common words, simple sentences
+        'school', 'teacher', 'friend', 'book', 'color', 'number', 'story',
+        'picture', 'family', 'house', 'animal', 'water', 'food', 'learn',
+        'help', 'like', 'want', 'need', 'think', 'know', 'read', 'write',
+        'draw', 'sing', 'dance', 'walk', 'talk', 'listen', 'watch', 'find',
+        'this', 'that', 'nice', 'fun', 'learning', 'is', 'to', 'me', 'my',
+        'answer', 'the', 'a', 'an'
+    }),
+    VocabularyComplexity.MODERATE: frozenset({
+        # Ages 7-8: More varied vocabulary
+        'understand', 'remember', 'important', 'different', 'together',
+        'language', 'question', 'explain', 'describe', 'compare',
+        'because', 'although', 'however', 'wonderful', 'interesting',
+        'difficult', 'easy', 'problem', 'solution', 'create', 'imagine'
+    }),
+    VocabularyComplexity.COMPLEX: frozenset({
+        # Ages 9-10: Advanced vocabulary
+        'communicate', 'conversation', 'pronunciation', 'vocabulary',
+        'appreciate', 'comprehend', 'demonstrate', 'participate',
+        'investigate', 'experience', 'opportunity', 'responsibility',
+        'independent', 'confident', 'enthusiastic', 'comfortable',
+        'comprehensively'
+    })
+})
+
+# Focused word lists for scenario types that narrow the vocabulary
+_GREETING_WORDS = frozenset({'hello', 'hi', 'bye', 'good', 'nice', 'please', 'thank'})
+_LEARNING_WORDS = frozenset({'learn', 'read', 'write', 'book', 'story', 'question', 'answer'})
+_SCENARIO_FOCUS_WORDS = MappingProxyType({
+    'greeting': _GREETING_WORDS,
+    'introduction': _GREETING_WORDS,
+    'learning': _LEARNING_WORDS,
+    'educational': _LEARNING_WORDS,
+})
+
+# Each level's vocabulary narrowed per focused scenario type, keyed by
+# (complexity, scenario type)
+_SCENARIO_VOCABULARY = MappingProxyType({
+    (complexity, scenario_type): tuple(vocab_set & focus_words)
+    for complexity, vocab_set in _VOCABULARY_BY_COMPLEXITY.items()
+    for scenario_type, focus_words in _SCENARIO_FOCUS_WORDS.items()
+})
+
+# Reverse index for per-word lookups. A word listed at several levels keeps
+# the simplest one, so the levels are read from the most complex down
+_WORD_TO_COMPLEXITY = MappingProxyType({
+    word: complexity
+    for complexity, vocab_set in reversed(_VOCABULARY_BY_COMPLEXITY.items())
+    for word in vocab_set
+})
+
+# Age group to complexity mapping
+_AGE_GROUP_COMPLEXITY = MappingProxyType({
+    AgeGroup.JUNIOR_INFANTS: VocabularyComplexity.VERY_SIMPLE,
+    AgeGroup.SENIOR_INFANTS: VocabularyComplexity.SIMPLE,
+    AgeGroup.FIRST_CLASS: VocabularyComplexity.SIMPLE,
+    AgeGroup.SECOND_CLASS: VocabularyComplexity.MODERATE,
+    AgeGroup.THIRD_CLASS: VocabularyComplexity.MODERATE,
+    AgeGroup.FOURTH_CLASS: VocabularyComplexity.COMPLEX,
+})
+
+# Irish curriculum stage mapping for age groups
+_AGE_TO_CURRICULUM_STAGE = MappingProxyType({
+    AgeGroup.JUNIOR_INFANTS: IrishCurriculumStage.JUNIOR_INFANTS_STAGE,
+    AgeGroup.SENIOR_INFANTS: IrishCurriculumStage.SENIOR_INFANTS_STAGE,
+    AgeGroup.FIRST_CLASS: IrishCurriculumStage.FIRST_CLASS_STAGE,
+    AgeGroup.SECOND_CLASS: IrishCurriculumStage.SECOND_CLASS_STAGE,
+    AgeGroup.THIRD_CLASS: IrishCurriculumStage.THIRD_CLASS_STAGE,
+    AgeGroup.FOURTH_CLASS: IrishCurriculumStage.FOURTH_CLASS_STAGE
+})
+
+# Developmental milestone mapping for curriculum stages
+_STAGE_TO_MILESTONE = MappingProxyType({
+    IrishCurriculumStage.JUNIOR_INFANTS_STAGE: DevelopmentalMilestone.FOUNDATION_LITERACY,
+    IrishCurriculumStage.SENIOR_INFANTS_STAGE: DevelopmentalMilestone.EMERGING_READER,
+    IrishCurriculumStage.FIRST_CLASS_STAGE: DevelopmentalMilestone.DEVELOPING_READER,
+    IrishCurriculumStage.SECOND_CLASS_STAGE: DevelopmentalMilestone.INDEPENDENT_READER,
+    IrishCurriculumStage.THIRD_CLASS_STAGE: DevelopmentalMilestone.ADVANCED_READER,
+    IrishCurriculumStage.FOURTH_CLASS_STAGE: DevelopmentalMilestone.CRITICAL_THINKER
+})
+
+# Curriculum area keywords for content classification
+_CURRICULUM_AREA_KEYWORDS = MappingProxyType({
+    CurriculumArea.ENGLISH: frozenset({
+        'read', 'write', 'story', 'book', 'letter', 'word', 'sentence', 'poem', 'rhyme',
+        'speak', 'listen', 'talk', 'say', 'tell', 'language', 'alphabet', 'spelling',
+        'grammar', 'reading', 'writing', 'communication', 'vocabulary', 'literature'
+    }),
+    CurriculumArea.MATHEMATICS: frozenset({
+        'number', 'count', 'add', 'subtract', 'multiply', 'divide', 'math', 'maths',
+        'calculate', 'solve', 'problem', 'shape', 'pattern', 'measure', 'size',
+        'length', 'weight', 'time', 'money', 'graph', 'data', 'fraction', 'decimal'
+    }),
+    CurriculumArea.SCIENCE: frozenset({
+        'science', 'experiment', 'observe', 'discover', 'nature', 'animal', 'plant',
+        'earth', 'space', 'weather', 'light', 'sound', 'water', 'air', 'energy',
+        'material', 'living', 'environment', 'investigate', 'explore', 'hypothesis'
+    }),
+    CurriculumArea.HISTORY: frozenset({
+        'history', 'past', 'ago', 'old', 'ancient', 'before', 'timeline', 'story',
+        'people', 'family', 'tradition', 'culture', 'heritage', 'ancestor',
+        'events', 'change', 'time', 'ireland', 'irish', 'dublin', 'castle'
+    }),
+    CurriculumArea.GEOGRAPHY: frozenset({
+        'place', 'location', 'map', 'country', 'city', 'town', 'village', 'home',
+        'travel', 'direction', 'geography', 'world', 'earth', 'land', 'sea',
+        'mountain', 'river', 'forest', 'farm', 'ireland', 'dublin', 'environment'
+    }),
+    CurriculumArea.SPHE: frozenset({
+        'feel', 'emotion', 'happy', 'sad', 'friend', 'friendship', 'kind', 'help',
+        'share', 'care', 'family', 'safe', 'healthy', 'exercise', 'food',
+        'myself', 'others', 'community', 'respect', 'responsibility', 'decision'
+    }),
+    CurriculumArea.ARTS: frozenset({
+        'draw', 'paint', 'color', 'picture', 'art', 'create', 'make', 'music',
+        'sing', 'dance', 'drama', 'play', 'creative', 'imagination', 'beautiful',
+        'express', 'design', 'craft', 'instrument', 'song', 'performance'
+    }),
+    CurriculumArea.PHYSICAL_EDUCATION: frozenset({
+        'run', 'jump', 'play', 'game', 'sport', 'exercise', 'move', 'body',
+        'healthy', 'strong', 'fit', 'team', 'ball', 'active', 'physical',
+        'outdoor', 'balance', 'coordination', 'skills', 'competition', 'fun'
+    })
+})
+
+
+# Curriculum-aligned learning objectives by stage
+_STAGE_LEARNING_OBJECTIVES = MappingProxyType({
+    IrishCurriculumStage.JUNIOR_INFANTS_STAGE: MappingProxyType({
+        'oral_language': 'Develop basic speaking and listening skills',
+        'early_literacy': 'Recognize letters and simple words',
+        'social_skills': 'Learn to interact with peers and adults',
+        'self_care': 'Develop independence in basic tasks'
+    }),
+    IrishCurriculumStage.SENIOR_INFANTS_STAGE: MappingProxyType({
+        'reading_readiness': 'Begin to read simple texts',
+        'writing_readiness': 'Form letters and write simple words',
+        'numeracy': 'Understand basic number concepts',
+        'confidence': 'Build confidence in learning'
+    }),
+    IrishCurriculumStage.FIRST_CLASS_STAGE: MappingProxyType({
+        'reading_fluency': 'Read simple texts with understanding',
+        'writing_skills': 'Write simple sentences clearly',
+        'problem_solving': 'Solve basic mathematical problems',
+        'curiosity': 'Develop curiosity about the world'
+    }),
+    IrishCurriculumStage.SECOND_CLASS_STAGE: MappingProxyType({
+        'comprehension': 'Understand and discuss texts',
+        'expression': 'Express ideas clearly in writing',
+        'reasoning': 'Use logical thinking in problem solving',
+        'collaboration': 'Work effectively with others'
+    }),
+    IrishCurriculumStage.THIRD_CLASS_STAGE: MappingProxyType({
+        'analysis': 'Analyze and interpret information',
+        'creativity': 'Express ideas creatively',
+        'independence': 'Work independently on tasks',
+        'research': 'Find and use information effectively'
+    }),
+    IrishCurriculumStage.FOURTH_CLASS_STAGE: MappingProxyType({
+        'critical_thinking': 'Think critically about information',
+        'synthesis': 'Combine ideas from different sources',
+        'leadership': 'Show leadership in group activities',
+        'preparation': 'Prepare for transition to post-primary'
+    })
+})
+
+# Sentence structure guidance by age group
+_SENTENCE_STRUCTURE_GUIDANCE = MappingProxyType({
+    AgeGroup.JUNIOR_INFANTS: "very_short_simple",      # 2-4 words
+    AgeGroup.SENIOR_INFANTS: "short_simple",           # 4-6 words
+    AgeGroup.FIRST_CLASS: "simple_sentences",          # 6-8 words
+    AgeGroup.SECOND_CLASS: "compound_simple",          # 8-12 words
+    AgeGroup.THIRD_CLASS: "varied_sentences",          # 10-15 words
+    AgeGroup.FOURTH_CLASS: "complex_sentences"         # 12+ words
+})
+
+# Encouragement style by age group
+_ENCOURAGEMENT_STYLES = MappingProxyType({
+    AgeGroup.JUNIOR_INFANTS: "enthusiastic_simple",
+    AgeGroup.SENIOR_INFANTS: "warm_encouraging",
+    AgeGroup.FIRST_CLASS: "positive_growth_focused",
+    AgeGroup.SECOND_CLASS: "constructive_specific",
+    AgeGroup.THIRD_CLASS: "supportive_challenging",
+    AgeGroup.FOURTH_CLASS: "respectful_collaborative"
+})
+
+
+# The same prompts and replies are analyzed repeatedly (enhancement, progression
+# and quality checks each call in), so results are cached by exact text
+_ANALYSIS_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _analyze_vocabulary_complexity(text: str) -> VocabularyComplexity:
+    """Vocabulary complexity of text, see CurriculumIntegrationService"""
+    if not text or not text.strip():
+        return VocabularyComplexity.VERY_SIMPLE
+    
+    words = _words(text)
+    if not words:
+        return VocabularyComplexity.VERY_SIMPLE
+    
+    # Count words by complexity level
+    complexity_scores = {
+        VocabularyComplexity.VERY_SIMPLE: 0,
+        VocabularyComplexity.SIMPLE: 0,
+        VocabularyComplexity.MODERATE: 0,
+        VocabularyComplexity.COMPLEX: 0
+    }
+    
+    for word in words:
+        # Words not found in any set are assumed to be moderate complexity
+        complexity = _WORD_TO_COMPLEXITY.get(word, VocabularyComplexity.MODERATE)
+        complexity_scores[complexity] += 1
+    
+    # Improved logic: prioritize higher complexity if present
+    total_words = sum(complexity_scores.values())
+    if total_words == 0:
+        return VocabularyComplexity.VERY_SIMPLE
+    
+    # Calculate percentages for better decision making (the very simple share
+    # is never compared, so it is not computed)
+    complex_percent = (complexity_scores[VocabularyComplexity.COMPLEX] / total_words) * 100
+    moderate_percent = (complexity_scores[VocabularyComplexity.MODERATE] / total_words) * 100
+    simple_percent = (complexity_scores[VocabularyComplexity.SIMPLE] / total_words) * 100
+    
+    # If 30%+ of words are complex, classify as complex
+    if complex_percent >= 30:
+        return VocabularyComplexity.COMPLEX
+    # If 40%+ of words are moderate or complex, classify as moderate
+    elif (moderate_percent + complex_percent) >= 40:
+        return VocabularyComplexity.MODERATE
+    # If 50%+ of words are simple+, classify as simple
+    elif (simple_percent + moderate_percent + complex_percent) >= 50:
+        return VocabularyComplexity.SIMPLE
+    else:
+        return VocabularyComplexity.VERY_SIMPLE
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _identify_curriculum_areas(text: str) -> Tuple[CurriculumArea, ...]:
+    """Curriculum areas of text in declaration order; a tuple so it can be cached"""
+    text_lower = text.lower()
+    # Keywords match anywhere in the text, so "numbers" counts for "number"
+    identified_areas = []
+    for area, keywords in _CURRICULUM_AREA_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in text_lower:
+                # One hit is enough; skip the area's remaining keywords
+                identified_areas.append(area)
+                break
+    
+    # Default to English if no specific area identified (language learning context)
+    if not identified_areas:
+        identified_areas.append(CurriculumArea.ENGLISH)
+    
+    return tuple(identified_areas)
+
+
 class CurriculumIntegrationService(ICurriculumIntegrationService):
     """
     Curriculum integration service for Irish Primary School alignment.
@@ -74,156 +384,13 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
     classes from the monolithic processor. Now implements interface contract for dependency injection.
     """
     
-    def __init__(self):
-        """Initialize curriculum integration data and mappings."""
-        # Age-appropriate vocabulary sets (basic implementation)
-        self.vocabulary_by_complexity = {
-            VocabularyComplexity.VERY_SIMPLE: {
-                # Ages 4-5: Basic nouns, simple actions, common words
-                'hello', 'hi', 'bye', 'yes', 'no', 'please', 'thank', 'good', 'bad',
-                'big', 'small', 'red', 'blue', 'cat', 'dog', 'mom', 'dad', 'home',
-                'eat', 'play', 'run', 'sit', 'go', 'come', 'look', 'see', 'happy',
-                'sad', 'one', 'two', 'me', 'you', 'up', 'down', 'hot', 'cold'
-            },
-            VocabularyComplexity.SIMPLE: {
-                # Ages 5-7: Common words, simple sentences
-                'school', 'teacher', 'friend', 'book', 'color', 'number', 'story',
-                'picture', 'family', 'house', 'animal', 'water', 'food', 'learn',
-                'help', 'like', 'want', 'need', 'think', 'know', 'read', 'write',
-                'draw', 'sing', 'dance', 'walk', 'talk', 'listen', 'watch', 'find',
-                'this', 'that', 'nice', 'fun', 'learning', 'is', 'to', 'me', 'my',
-                'answer', 'the', 'a', 'an'
-            },
-            VocabularyComplexity.MODERATE: {
-                # Ages 7-8: More varied vocabulary
-                'understand', 'remember', 'important', 'different', 'together',
-                'language', 'question', 'explain', 'describe', 'compare',
-                'because', 'although', 'however', 'wonderful', 'interesting',
-                'difficult', 'easy', 'problem', 'solution', 'create', 'imagine'
-            },
-            VocabularyComplexity.COMPLEX: {
-                # Ages 9-10: Advanced vocabulary
-                'communicate', 'conversation', 'pronunciation', 'vocabulary',
-                'appreciate', 'comprehend', 'demonstrate', 'participate',
-                'investigate', 'experience', 'opportunity', 'responsibility',
-                'independent', 'confident', 'enthusiastic', 'comfortable',
-                'comprehensively'
-            }
-        }
-        
-        # Age group to complexity mapping
-        self.age_group_complexity = {
-            AgeGroup.JUNIOR_INFANTS: VocabularyComplexity.VERY_SIMPLE,
-            AgeGroup.SENIOR_INFANTS: VocabularyComplexity.SIMPLE,
-            AgeGroup.FIRST_CLASS: VocabularyComplexity.SIMPLE,
-            AgeGroup.SECOND_CLASS: VocabularyComplexity.MODERATE,
-            AgeGroup.THIRD_CLASS: VocabularyComplexity.MODERATE,
-            AgeGroup.FOURTH_CLASS: VocabularyComplexity.COMPLEX,
-        }
-        
-        # Irish curriculum stage mapping for age groups
-        self.age_to_curriculum_stage = {
-            AgeGroup.JUNIOR_INFANTS: IrishCurriculumStage.JUNIOR_INFANTS_STAGE,
-            AgeGroup.SENIOR_INFANTS: IrishCurriculumStage.SENIOR_INFANTS_STAGE,
-            AgeGroup.FIRST_CLASS: IrishCurriculumStage.FIRST_CLASS_STAGE,
-            AgeGroup.SECOND_CLASS: IrishCurriculumStage.SECOND_CLASS_STAGE,
-            AgeGroup.THIRD_CLASS: IrishCurriculumStage.THIRD_CLASS_STAGE,
-            AgeGroup.FOURTH_CLASS: IrishCurriculumStage.FOURTH_CLASS_STAGE
-        }
-        
-        # Developmental milestone mapping for curriculum stages
-        self.stage_to_milestone = {
-            IrishCurriculumStage.JUNIOR_INFANTS_STAGE: DevelopmentalMilestone.FOUNDATION_LITERACY,
-            IrishCurriculumStage.SENIOR_INFANTS_STAGE: DevelopmentalMilestone.EMERGING_READER,
-            IrishCurriculumStage.FIRST_CLASS_STAGE: DevelopmentalMilestone.DEVELOPING_READER,
-            IrishCurriculumStage.SECOND_CLASS_STAGE: DevelopmentalMilestone.INDEPENDENT_READER,
-            IrishCurriculumStage.THIRD_CLASS_STAGE: DevelopmentalMilestone.ADVANCED_READER,
-            IrishCurriculumStage.FOURTH_CLASS_STAGE: DevelopmentalMilestone.CRITICAL_THINKER
-        }
-        
-        # Curriculum area keywords for content classification
-        self.curriculum_area_keywords = {
-            CurriculumArea.ENGLISH: {
-                'read', 'write', 'story', 'book', 'letter', 'word', 'sentence', 'poem', 'rhyme',
-                'speak', 'listen', 'talk', 'say', 'tell', 'language', 'alphabet', 'spelling',
-                'grammar', 'reading', 'writing', 'communication', 'vocabulary', 'literature'
-            },
-            CurriculumArea.MATHEMATICS: {
-                'number', 'count', 'add', 'subtract', 'multiply', 'divide', 'math', 'maths',
-                'calculate', 'solve', 'problem', 'shape', 'pattern', 'measure', 'size',
-                'length', 'weight', 'time', 'money', 'graph', 'data', 'fraction', 'decimal'
-            },
-            CurriculumArea.SCIENCE: {
-                'science', 'experiment', 'observe', 'discover', 'nature', 'animal', 'plant',
-                'earth', 'space', 'weather', 'light', 'sound', 'water', 'air', 'energy',
-                'material', 'living', 'environment', 'investigate', 'explore', 'hypothesis'
-            },
-            CurriculumArea.HISTORY: {
-                'history', 'past', 'ago', 'old', 'ancient', 'before', 'timeline', 'story',
-                'people', 'family', 'tradition', 'culture', 'heritage', 'ancestor',
-                'events', 'change', 'time', 'ireland', 'irish', 'dublin', 'castle'
-            },
-            CurriculumArea.GEOGRAPHY: {
-                'place', 'location', 'map', 'country', 'city', 'town', 'village', 'home',
-                'travel', 'direction', 'geography', 'world', 'earth', 'land', 'sea',
-                'mountain', 'river', 'forest', 'farm', 'ireland', 'dublin', 'environment'
-            },
-            CurriculumArea.SPHE: {
-                'feel', 'emotion', 'happy', 'sad', 'friend', 'friendship', 'kind', 'help',
-                'share', 'care', 'family', 'safe', 'healthy', 'exercise', 'food',
-                'myself', 'others', 'community', 'respect', 'responsibility', 'decision'
-            },
-            CurriculumArea.ARTS: {
-                'draw', 'paint', 'color', 'picture', 'art', 'create', 'make', 'music',
-                'sing', 'dance', 'drama', 'play', 'creative', 'imagination', 'beautiful',
-                'express', 'design', 'craft', 'instrument', 'song', 'performance'
-            },
-            CurriculumArea.PHYSICAL_EDUCATION: {
-                'run', 'jump', 'play', 'game', 'sport', 'exercise', 'move', 'body',
-                'healthy', 'strong', 'fit', 'team', 'ball', 'active', 'physical',
-                'outdoor', 'balance', 'coordination', 'skills', 'competition', 'fun'
-            }
-        }
-        
-        # Curriculum-aligned learning objectives by stage
-        self.stage_learning_objectives = {
-            IrishCurriculumStage.JUNIOR_INFANTS_STAGE: {
-                'oral_language': 'Develop basic speaking and listening skills',
-                'early_literacy': 'Recognize letters and simple words',
-                'social_skills': 'Learn to interact with peers and adults',
-                'self_care': 'Develop independence in basic tasks'
-            },
-            IrishCurriculumStage.SENIOR_INFANTS_STAGE: {
-                'reading_readiness': 'Begin to read simple texts',
-                'writing_readiness': 'Form letters and write simple words',
-                'numeracy': 'Understand basic number concepts',
-                'confidence': 'Build confidence in learning'
-            },
-            IrishCurriculumStage.FIRST_CLASS_STAGE: {
-                'reading_fluency': 'Read simple texts with understanding',
-                'writing_skills': 'Write simple sentences clearly',
-                'problem_solving': 'Solve basic mathematical problems',
-                'curiosity': 'Develop curiosity about the world'
-            },
-            IrishCurriculumStage.SECOND_CLASS_STAGE: {
-                'comprehension': 'Understand and discuss texts',
-                'expression': 'Express ideas clearly in writing',
-                'reasoning': 'Use logical thinking in problem solving',
-                'collaboration': 'Work effectively with others'
-            },
-            IrishCurriculumStage.THIRD_CLASS_STAGE: {
-                'analysis': 'Analyze and interpret information',
-                'creativity': 'Express ideas creatively',
-                'independence': 'Work independently on tasks',
-                'research': 'Find and use information effectively'
-            },
-            IrishCurriculumStage.FOURTH_CLASS_STAGE: {
-                'critical_thinking': 'Think critically about information',
-                'synthesis': 'Combine ideas from different sources',
-                'leadership': 'Show leadership in group activities',
-                'preparation': 'Prepare for transition to post-primary'
-            }
-        }
+    # Curriculum data is read-only and shared by every instance
+    vocabulary_by_complexity: ClassVar[Mapping[VocabularyComplexity, FrozenSet[str]]] = _VOCABULARY_BY_COMPLEXITY
+    age_group_complexity: ClassVar[Mapping[AgeGroup, VocabularyComplexity]] = _AGE_GROUP_COMPLEXITY
+    age_to_curriculum_stage: ClassVar[Mapping[AgeGroup, IrishCurriculumStage]] = _AGE_TO_CURRICULUM_STAGE
+    stage_to_milestone: ClassVar[Mapping[IrishCurriculumStage, DevelopmentalMilestone]] = _STAGE_TO_MILESTONE
+    curriculum_area_keywords: ClassVar[Mapping[CurriculumArea, FrozenSet[str]]] = _CURRICULUM_AREA_KEYWORDS
+    stage_learning_objectives: ClassVar[Mapping[IrishCurriculumStage, Mapping[str, str]]] = _STAGE_LEARNING_OBJECTIVES
     
     def get_age_appropriate_vocabulary(
         self, 
@@ -241,29 +408,17 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
             List of appropriate vocabulary words
         """
         # Convert string age group to enum
-        try:
-            age_enum = AgeGroup(age_group.lower())
-        except ValueError:
-            age_enum = AgeGroup.FIRST_CLASS  # Default fallback
+        age_enum = _AGE_GROUPS_BY_VALUE.get(age_group.lower(), AgeGroup.FIRST_CLASS)  # Default fallback
         
         # Get appropriate complexity level
         complexity = self.age_group_complexity.get(age_enum, VocabularyComplexity.SIMPLE)
-        vocabulary_set = self.vocabulary_by_complexity.get(complexity, set())
-        
-        # Filter by scenario type if specific vocabulary needed
-        if scenario_type.lower() in ['greeting', 'introduction']:
-            # Basic greeting vocabulary
-            filtered_vocab = {word for word in vocabulary_set 
-                            if word in ['hello', 'hi', 'bye', 'good', 'nice', 'please', 'thank']}
-        elif scenario_type.lower() in ['learning', 'educational']:
-            # Learning-focused vocabulary
-            filtered_vocab = {word for word in vocabulary_set 
-                            if word in ['learn', 'read', 'write', 'book', 'story', 'question', 'answer']}
-        else:
-            # Return all vocabulary for general scenarios
-            filtered_vocab = vocabulary_set
         
-        return list(filtered_vocab)
+        # Greeting and learning scenarios use a precomputed focused subset;
+        # all other scenarios get the full vocabulary for the level
+        focused_vocab = _SCENARIO_VOCABULARY.get((complexity, scenario_type.lower()))
+        if focused_vocab is not None:
+            return list(focused_vocab)
+        return list(self.vocabulary_by_complexity.get(complexity, frozenset()))
     
     def validate_curriculum_alignment(
         self, 
@@ -281,10 +436,9 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
             Dictionary with alignment validation results
         """
         # Convert string to enum
-        try:
-            stage_enum = IrishCurriculumStage(curriculum_stage.lower())
-        except ValueError:
-            stage_enum = IrishCurriculumStage.FIRST_CLASS_STAGE  # Default fallback
+        stage_enum = _CURRICULUM_STAGES_BY_VALUE.get(
+            curriculum_stage.lower(), IrishCurriculumStage.FIRST_CLASS_STAGE  # Default fallback
+        )
         
         return self.assess_curriculum_alignment(content, stage_enum)
     
@@ -363,58 +517,7 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
         Returns:
             VocabularyComplexity level
         """
-        if not text or not text.strip():
-            return VocabularyComplexity.VERY_SIMPLE
-        
-        words = text.lower().split()
-        if not words:
-            return VocabularyComplexity.VERY_SIMPLE
-        
-        # Count words by complexity level
-        complexity_scores = {
-            VocabularyComplexity.VERY_SIMPLE: 0,
-            VocabularyComplexity.SIMPLE: 0,
-            VocabularyComplexity.MODERATE: 0,
-            VocabularyComplexity.COMPLEX: 0
-        }
-        
-        for word in words:
-            # Remove punctuation for word matching
-            clean_word = ''.join(c for c in word if c.isalpha())
-            if not clean_word:
-                continue
-                
-            # Check which complexity level this word belongs to
-            found = False
-            for complexity, vocab_set in self.vocabulary_by_complexity.items():
-                if clean_word in vocab_set:
-                    complexity_scores[complexity] += 1
-                    found = True
-                    break
-            
-            # If word not found in any set, assume it's moderate complexity
-            if not found:
-                complexity_scores[VocabularyComplexity.MODERATE] += 1
-        
-        # Improved logic: prioritize higher complexity if present
-        total_words = sum(complexity_scores.values())
-        if total_words == 0:
-            return VocabularyComplexity.VERY_SIMPLE
-        
-        # Calculate percentages for better decision making
-        percentages = {k: (v / total_words) * 100 for k, v in complexity_scores.items()}
-        
-        # If 30%+ of words are complex, classify as complex
-        if percentages[VocabularyComplexity.COMPLEX] >= 30:
-            return VocabularyComplexity.COMPLEX
-        # If 40%+ of words are moderate or complex, classify as moderate
-        elif (percentages[VocabularyComplexity.MODERATE] + percentages[VocabularyComplexity.COMPLEX]) >= 40:
-            return VocabularyComplexity.MODERATE
-        # If 50%+ of words are simple+, classify as simple
-        elif (percentages[VocabularyComplexity.SIMPLE] + percentages[VocabularyComplexity.MODERATE] + percentages[VocabularyComplexity.COMPLEX]) >= 50:
-            return VocabularyComplexity.SIMPLE
-        else:
-            return VocabularyComplexity.VERY_SIMPLE
+        return _analyze_vocabulary_complexity(text)
     
     def assess_developmental_appropriateness(self, text: str, age_group: AgeGroup) -> DevelopmentalAppropriateness:
         """
@@ -433,16 +536,8 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
         text_complexity = self.analyze_vocabulary_complexity(text)
         target_complexity = self.age_group_complexity.get(age_group, VocabularyComplexity.SIMPLE)
         
-        # Define complexity ordering for comparison
-        complexity_order = [
-            VocabularyComplexity.VERY_SIMPLE,
-            VocabularyComplexity.SIMPLE,
-            VocabularyComplexity.MODERATE,
-            VocabularyComplexity.COMPLEX
-        ]
-        
-        text_level = complexity_order.index(text_complexity)
-        target_level = complexity_order.index(target_complexity)
+        text_level = text_complexity.ordinal
+        target_level = target_complexity.ordinal
         
         # Assess appropriateness based on level difference
         if text_level < target_level - 1:
@@ -464,18 +559,7 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
     
     def identify_curriculum_areas(self, text: str) -> List[CurriculumArea]:
         """Identify relevant curriculum areas from text content."""
-        text_lower = text.lower()
-        identified_areas = []
-        
-        for area, keywords in self.curriculum_area_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                identified_areas.append(area)
-        
-        # Default to English if no specific area identified (language learning context)
-        if not identified_areas:
-            identified_areas.append(CurriculumArea.ENGLISH)
-        
-        return identified_areas
+        return list(_identify_curriculum_areas(text))
     
     def assess_curriculum_alignment(self, text: str, curriculum_stage: IrishCurriculumStage) -> Dict[str, Any]:
         """Assess how well content aligns with curriculum stage requirements."""
@@ -572,27 +656,11 @@ class CurriculumIntegrationService(ICurriculumIntegrationService):
     
     def _get_sentence_structure_guidance(self, age_group: AgeGroup) -> str:
         """Get sentence structure guidance for age group."""
-        structure_map = {
-            AgeGroup.JUNIOR_INFANTS: "very_short_simple",      # 2-4 words
-            AgeGroup.SENIOR_INFANTS: "short_simple",           # 4-6 words
-            AgeGroup.FIRST_CLASS: "simple_sentences",          # 6-8 words
-            AgeGroup.SECOND_CLASS: "compound_simple",          # 8-12 words
-            AgeGroup.THIRD_CLASS: "varied_sentences",          # 10-15 words
-            AgeGroup.FOURTH_CLASS: "complex_sentences"         # 12+ words
-        }
-        return structure_map.get(age_group, "simple_sentences")
+        return _SENTENCE_STRUCTURE_GUIDANCE.get(age_group, "simple_sentences")
     
     def _get_encouragement_style(self, age_group: AgeGroup) -> str:
         """Get encouragement style for age group."""
-        style_map = {
-            AgeGroup.JUNIOR_INFANTS: "enthusiastic_simple",
-            AgeGroup.SENIOR_INFANTS: "warm_encouraging",
-            AgeGroup.FIRST_CLASS: "positive_growth_focused",
-            AgeGroup.SECOND_CLASS: "constructive_specific",
-            AgeGroup.THIRD_CLASS: "supportive_challenging",
-            AgeGroup.FOURTH_CLASS: "respectful_collaborative"
-        }
-        return style_map.get(age_group, "positive_growth_focused")
+        return _ENCOURAGEMENT_STYLES.get(age_group, "positive_growth_focused")
     
     def generate_curriculum_aligned_suggestions(self, text: str, curriculum_stage: IrishCurriculumStage,
                                               age_group: AgeGroup) -> Dict[str, str]:
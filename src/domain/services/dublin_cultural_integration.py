@@ -79,7 +79,7 @@ class DublinCulturalIntegrationService:
         
         # Step 5: Validate cultural authenticity
         full_content = f"{cultural_balance.dublin_context} {cultural_balance.integration_encouragement}"
-        authenticity_validation = await self.authenticity_validator.validate_cultural_content(full_content)
+        authenticity_validation = self.authenticity_validator.validate_cultural_content_sync(full_content)
         
         # Step 6: Generate conversation turns
         conversation_turns = self._generate_conversation_turns(
@@ -306,7 +306,7 @@ class DublinCulturalIntegrationService:
     async def validate_dublin_cultural_content(self, content: str) -> Dict[str, Any]:
         """Validate Dublin cultural content for authenticity and sensitivity"""
         
-        validation_result = await self.authenticity_validator.validate_cultural_content(content)
+        validation_result = self.authenticity_validator.validate_cultural_content_sync(content)
         
         return {
             "authenticity_score": validation_result.authenticity_score,
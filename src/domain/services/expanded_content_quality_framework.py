@@ -298,7 +298,7 @@ class ExpandedContentValidator:
         trauma_validation = await self._validate_trauma_informed_design(scenario)
         
         # Step 3: Cultural validation
-        cultural_validation = await self.cultural_validator.validate_cultural_content(
+        cultural_validation = self.cultural_validator.validate_cultural_content_sync(
             f"{scenario.english_demonstration} {scenario.chinese_comfort}"
         )
         
@@ -9,11 +9,20 @@ pipeline layer without coupling to specific LLM client implementations.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional
 from enum import Enum
 from .cultural_representation import CulturalRepresentationService
 
 
+def _plain_copy(value: Any) -> Any:
+    """Deep copy of shared read-only spec data as plain dicts and lists (JSON serializable)"""
+    if isinstance(value, Mapping):
+        return {key: _plain_copy(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_plain_copy(item) for item in value]
+    return value
+
+
 class EmotionalState(str, Enum):
     """Basic emotional state for Xiao Mei character - starting with friendly/encouraging"""
     FRIENDLY_ENCOURAGING = "friendly_encouraging"
@@ -125,21 +134,21 @@ class XiaoMeiCharacterService:
         """Return voice pattern specifications for TTS configuration."""
         return self._cultural_service.get_voice_pattern_specs()
 
-    def get_cultural_guidelines(self):
+    def get_cultural_guidelines(self) -> Dict[str, Any]:
         """Return cultural authenticity guidelines."""
-        return self._cultural_service.get_cultural_authenticity_guidelines()
+        return _plain_copy(self._cultural_service.get_cultural_authenticity_guidelines())
 
-    def get_seasonal_customization_options(self):
+    def get_seasonal_customization_options(self) -> Dict[str, Any]:
         """Return seasonal customization options for character progression."""
-        return self._cultural_service.get_seasonal_customization_options()
+        return _plain_copy(self._cultural_service.get_seasonal_customization_options())
 
     def validate_character_representation(self, description: str) -> dict:
         """Validate character representation against cultural guidelines."""
         return self._cultural_service.validate_cultural_representation(description)
 
-    def get_voice_configuration_for_tts(self) -> dict:
+    def get_voice_configuration_for_tts(self) -> Dict[str, Any]:
         """Return technical voice configuration for TTS integration."""
-        return self._cultural_service.get_character_voice_configuration()
+        return _plain_copy(self._cultural_service.get_character_voice_configuration())
 
     def get_irish_cultural_prompt_modifier(self) -> str:
         """Return Irish cultural integration prompt modifier."""
@@ -182,7 +191,9 @@ class XiaoMeiCharacterService:
                 base_response = base_response.replace("Good job!", "Grand job!")
         
         # Validate cultural sensitivity
-        validation = self._cultural_service.validate_irish_cultural_sensitivity(base_response)
+        validation = self._cultural_service.validate_irish_cultural_sensitivity(
+            base_response, collect_issues=False
+        )
         if not validation["culturally_appropriate"]:
             # Log issues but don't modify response drastically in real-time
             # This would be used for monitoring and training data review
@@ -190,9 +201,9 @@ class XiaoMeiCharacterService:
             
         return base_response
 
-    def get_irish_cultural_knowledge(self) -> dict:
+    def get_irish_cultural_knowledge(self) -> Dict[str, Any]:
         """Get Irish cultural knowledge for character awareness"""
-        return self._cultural_service.get_irish_cultural_integration()
+        return _plain_copy(self._cultural_service.get_irish_cultural_integration())
 
     def create_cultural_bridge_statement(self, chinese_concept: str, irish_context: str = None) -> str:
         """Create balanced cultural bridge connecting Chinese and Irish elements"""
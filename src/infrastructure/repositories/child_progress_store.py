@@ -0,0 +1,105 @@
+"""
+Child Progress Store
+
+SQLite-backed storage for character customization progress. Every worker process
+pointing at the same database file sees the same ChildProgress records, and the
+records survive restarts.
+
+Plugs into CharacterCustomizationService through its progress_store argument.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Iterator
+
+from src.domain.services.character_customization import ChildProgress
+
+
+class SQLiteChildProgressStore(MutableMapping):
+    """
+    Mapping of child_id -> ChildProgress persisted as JSON records.
+
+    Writes go straight through to SQLite. A per-process LRU keeps hot children
+    in memory so repeat reads skip the query and decoding; with several
+    workers updating the same child, use cache_size=0 or sticky routing so a
+    worker never serves a stale cached record.
+    """
+
+    def __init__(self, path: str, cache_size: int = 10_000):
+        """
+        Args:
+            path: SQLite database file (":memory:" for a private in-memory store)
+            cache_size: Maximum number of ChildProgress records kept in memory
+        """
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, ChildProgress]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS child_progress ("
+            "child_id TEXT PRIMARY KEY, record BLOB NOT NULL)"
+        )
+
+    def _remember(self, child_id: str, progress: ChildProgress) -> None:
+        """Put a record at the hot end of the LRU, evicting the coldest"""
+        if self._cache_size <= 0:
+            return
+        self._cache[child_id] = progress
+        self._cache.move_to_end(child_id)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def __getitem__(self, child_id: str) -> ChildProgress:
+        with self._lock:
+            progress = self._cache.get(child_id)
+            if progress is not None:
+                self._cache.move_to_end(child_id)
+                return progress
+
+            row = self._conn.execute(
+                "SELECT record FROM child_progress WHERE child_id = ?", (child_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(child_id)
+
+            progress = ChildProgress.from_dict(json.loads(row[0]))
+            self._remember(child_id, progress)
+            return progress
+
+    def __setitem__(self, child_id: str, progress: ChildProgress) -> None:
+        record = progress.to_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO child_progress (child_id, record) VALUES (?, ?)",
+                (child_id, record)
+            )
+            self._remember(child_id, progress)
+
+    def __delitem__(self, child_id: str) -> None:
+        with self._lock:
+            self._cache.pop(child_id, None)
+            cursor = self._conn.execute(
+                "DELETE FROM child_progress WHERE child_id = ?", (child_id,)
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(child_id)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT child_id FROM child_progress").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM child_progress").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection and drop cached records"""
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()